@@ -10,6 +10,12 @@ except Exception:
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
+try:
+    import lxml  # noqa: F401  C-backed tree builder, much faster than html.parser
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 class SEOModule(ABC):
     """
     Abstract base class for all SEO analysis modules.
@@ -39,6 +45,10 @@ class SEOModule(ABC):
         backoff = float(self.global_config.get("http_backoff_factor", 0.2))
         status_forcelist = self.global_config.get("http_status_forcelist", [429, 500, 502, 503, 504])
         allowed_methods = self.global_config.get("http_allowed_retry_methods", ["HEAD", "GET", "OPTIONS"])
+        # Link/image checks fan out HEADs across threads; size the pool so they don't thrash connections
+        pool_connections = int(self.global_config.get("http_pool_connections", 16))
+        pool_maxsize = int(self.global_config.get("http_pool_maxsize", 32))
+        retry_cfg = 0
         if Retry is not None and retries_total > 0:
             retry_cfg = Retry(
                 total=retries_total,
@@ -49,9 +59,10 @@ class SEOModule(ABC):
                 allowed_methods=set(m.upper() for m in allowed_methods),
                 raise_on_status=False,
             )
-            adapter = HTTPAdapter(max_retries=retry_cfg)
-            self.session.mount('http://', adapter)
-            self.session.mount('https://', adapter)
+        # Mount the sized pool even with retries disabled so connections are still reused
+        adapter = HTTPAdapter(max_retries=retry_cfg, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # Update session headers
         self.session.headers.update(self.headers)
         # Potentially add common configuration here, e.g., API keys if shared
@@ -70,28 +81,58 @@ class SEOModule(ABC):
         """
         pass
 
-    def fetch_html(self, url: str) -> BeautifulSoup | None:
+    def fetch_body(self, url: str, headers: dict | None = None) -> tuple[requests.Response | None, bytes | None]:
         """
-        Fetches the HTML content of a URL and returns a BeautifulSoup object.
+        Fetches a URL and returns the response with its body, capped at Global.max_html_bytes.
 
         Args:
             url (str): The URL to fetch.
+            headers (dict | None): Extra request headers, e.g. conditional-request validators.
 
         Returns:
-            BeautifulSoup | None: A BeautifulSoup object if successful, None otherwise.
+            tuple: (response, body bytes) if successful, (None, None) otherwise. The response's
+                   stream is already consumed; use it for status and headers only.
         """
         timeout = self.global_config.get("request_timeout", 10) # Use configured timeout
+        # Cap the body so oversized or endless responses can't stall parsing or exhaust memory (0 disables)
+        max_bytes = int(self.global_config.get("max_html_bytes", 5_000_000))
         try:
-            resp = self.session.get(url, timeout=timeout)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.content, 'html.parser')
+            with self.session.get(url, timeout=timeout, stream=True, headers=headers) as resp:
+                resp.raise_for_status()
+                body = bytearray()
+                for chunk in resp.iter_content(chunk_size=65536):
+                    body += chunk
+                    if max_bytes and len(body) >= max_bytes:
+                        del body[max_bytes:]
+                        break
+            return resp, bytes(body)
         except requests.exceptions.RequestException as e:
             if self.global_config.get("debug"):
                 print(f"Error fetching URL {url} in {self.module_name}: {e}")
-            return None
+            return None, None
         except Exception as e:
             if self.global_config.get("debug"):
                 print(f"An unexpected error occurred while fetching {url} in {self.module_name}: {e}")
+            return None, None
+
+    def fetch_html(self, url: str) -> BeautifulSoup | None:
+        """
+        Fetches the HTML content of a URL and returns a BeautifulSoup object.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            BeautifulSoup | None: A BeautifulSoup object if successful, None otherwise.
+        """
+        _, body = self.fetch_body(url)
+        if body is None:
+            return None
+        try:
+            return BeautifulSoup(body, HTML_PARSER)
+        except Exception as e:
+            if self.global_config.get("debug"):
+                print(f"An unexpected error occurred while parsing {url} in {self.module_name}: {e}")
             return None
 
     def request(self, method: str, url: str, **kwargs):
@@ -1,3 +1,4 @@
+import copy
 from bs4 import BeautifulSoup, Comment
 from ..base_module import SEOModule
 from .keywords import analyze_keywords
@@ -17,15 +18,17 @@ class ContentAnalyzer(SEOModule):
         self.top_n_keywords = self.content_config.get("top_n_keywords_count", 10)
         self.spellcheck_lang = self.content_config.get("spellcheck_language", "en")
 
-    def analyze(self, url: str) -> dict:
+    def analyze(self, url: str, soup: BeautifulSoup | None = None) -> dict:
+        # `soup` may be a page the caller already parsed; it is copied before anything is removed
         results = {"content_analysis_status": "pending"}
-        soup = self.fetch_html(url)
+        if soup is None:
+            soup = self.fetch_html(url)
         if not soup:
             results["content_analysis_status"] = "failed_to_fetch_html"
             results["error_message"] = f"Could not retrieve or parse HTML from {url}"
             return {self.module_name: results}
 
-        text_soup = BeautifulSoup(str(soup), 'html.parser')
+        text_soup = copy.copy(soup)
         for element in text_soup(["script", "style", "nav", "footer", "aside", "header", "noscript"]):
             element.decompose()
         for comment in text_soup.find_all(string=lambda text: isinstance(text, Comment)):
@@ -1,6 +1,7 @@
 import re
 from urllib.parse import urlparse, unquote
 from bs4 import BeautifulSoup
+from .dom_index import DomIndex
 
 try:
     # Reuse content utilities for tokenization/stopwords
@@ -15,6 +16,18 @@ except Exception:  # Fallback minimal
             words = [w for w in words if len(w) >= min_word_length]
         return words
 
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9\-]+')
+_MULTI_HYPHEN_RE = re.compile(r'-{2,}')
+_SLUG_SPECIAL_RE = re.compile(r'[^a-zA-Z0-9\-]')
+_ALNUM_RUN_RE = re.compile(r'[a-zA-Z0-9]+')
+_FILE_EXT_RE = re.compile(r'\.[a-zA-Z0-9]+$')
+_GENERIC_IMG_NAME_RE = re.compile(r'(img|image|photo|pic|dsc)[-_]?\d{2,}')
+_BREADCRUMB_SCHEMA_RE = re.compile("schema.org/BreadcrumbList", re.I)
+_BREADCRUMB_CLASS_RE = re.compile("breadcrumb", re.I)
+_DATE_META_NAME_RE = re.compile(r"date|dc.date|dcterms\.created", re.I)
+_PUBLISHED_ITEMPROP_RE = re.compile(r"datePublished|dateCreated", re.I)
+_MODIFIED_ITEMPROP_RE = re.compile(r"dateModified", re.I)
+
 
 def analyze_keyword_placement(soup: BeautifulSoup, visible_text: str, target_keywords: list[str] | None) -> dict:
     primary_kw = (target_keywords[0].strip() if target_keywords else None) or None
@@ -28,11 +41,12 @@ def analyze_keyword_placement(soup: BeautifulSoup, visible_text: str, target_key
     total_occurrences = 0
     in_first_para = False
     secondary_found = []
+    # Lowercase the page text once for both the primary and secondary keyword checks
+    low = visible_text.lower() if visible_text and (primary_kw or sec_kws) else ''
     if primary_kw and visible_text:
-        total_occurrences = visible_text.lower().count(primary_kw.lower())
+        total_occurrences = low.count(primary_kw.lower())
         in_first_para = bool(first_paragraph and primary_kw.lower() in first_paragraph.lower())
     if sec_kws and visible_text:
-        low = visible_text.lower()
         for s in sec_kws:
             if s and s.lower() in low:
                 secondary_found.append(s)
@@ -56,8 +70,8 @@ def analyze_keyword_placement(soup: BeautifulSoup, visible_text: str, target_key
 
 def _slugify_like(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r'[^a-z0-9\-]+', '-', s)
-    s = re.sub(r'-{2,}', '-', s)
+    s = _SLUG_INVALID_RE.sub('-', s)
+    s = _MULTI_HYPHEN_RE.sub('-', s)
     return s.strip('-')
 
 
@@ -67,10 +81,10 @@ def check_url_slug_quality(url: str, primary_keyword: str | None) -> dict:
     segments = [seg for seg in path.split('/') if seg]
     slug = segments[-1] if segments else ''
     has_hyphens = '-' in slug
-    special_chars = bool(re.search(r'[^a-zA-Z0-9\-]', slug))
+    special_chars = bool(_SLUG_SPECIAL_RE.search(slug))
     contains_primary = bool(primary_keyword and primary_keyword.lower() in slug.lower())
     # Stopword heaviness
-    slug_words = re.findall(r'[a-zA-Z0-9]+', slug.lower())
+    slug_words = _ALNUM_RUN_RE.findall(slug.lower())
     stopwords_in_slug = sum(1 for w in slug_words if w in STOPWORDS)
     return {
         "urlSlug": slug,
@@ -82,8 +96,8 @@ def check_url_slug_quality(url: str, primary_keyword: str | None) -> dict:
     }
 
 
-def analyze_images_keywords(soup: BeautifulSoup, primary_keyword: str | None) -> dict:
-    imgs = soup.find_all('img')
+def analyze_images_keywords(dom: DomIndex, primary_keyword: str | None) -> dict:
+    imgs = dom.tags('img')
     kw_in_alt = 0
     descriptive_filenames_issues = []
     for img in imgs:
@@ -95,9 +109,9 @@ def analyze_images_keywords(soup: BeautifulSoup, primary_keyword: str | None) ->
         if src and not src.startswith(('data:', 'blob:')):
             name = src.split('/')[-1]
             name_no_ext = name.split('?')[0]
-            base = re.sub(r'\.[a-zA-Z0-9]+$', '', name_no_ext)
+            base = _FILE_EXT_RE.sub('', name_no_ext)
             base_low = base.lower()
-            if re.fullmatch(r'(img|image|photo|pic|dsc)[-_]?\d{2,}', base_low) or len(base_low) <= 3:
+            if _GENERIC_IMG_NAME_RE.fullmatch(base_low) or len(base_low) <= 3:
                 descriptive_filenames_issues.append(src)
     return {
         "imagesWithPrimaryKeywordAlt": kw_in_alt,
@@ -107,18 +121,18 @@ def analyze_images_keywords(soup: BeautifulSoup, primary_keyword: str | None) ->
 
 
 def detect_breadcrumbs(soup: BeautifulSoup) -> dict:
-    has_breadcrumb_schema = bool(soup.find(attrs={"itemtype": re.compile("schema.org/BreadcrumbList", re.I)}))
-    breadcrumb_like = soup.find(class_=re.compile("breadcrumb", re.I)) or soup.find("nav", class_=re.compile("breadcrumb", re.I))
+    has_breadcrumb_schema = bool(soup.find(attrs={"itemtype": _BREADCRUMB_SCHEMA_RE}))
+    breadcrumb_like = soup.find(class_=_BREADCRUMB_CLASS_RE) or soup.find("nav", class_=_BREADCRUMB_CLASS_RE)
     return {
         "hasBreadcrumbs": bool(has_breadcrumb_schema or breadcrumb_like),
     }
 
 
-def detect_share_buttons(soup: BeautifulSoup) -> dict:
-    hrefs = [a.get('href', '') for a in soup.find_all('a', href=True)]
+def detect_share_buttons(dom: DomIndex) -> dict:
+    hrefs = [a.get('href') for a in dom.tags('a') if a.get('href') is not None]
     share_domains = ['facebook.com/sharer', 'twitter.com/intent', 'linkedin.com/share', 'wa.me/', 'api.whatsapp.com', 't.me/share']
     has_share = any(any(dom in h for dom in share_domains) for h in hrefs)
-    classes_text = ' '.join([c for tag in soup.find_all(True) for c in (tag.get('class') or [])])
+    classes_text = ' '.join([c for tags in dom.by_tag.values() for tag in tags for c in (tag.get('class') or [])])
     if 'share' in classes_text.lower():
         has_share = True
     return {"hasShareButtons": has_share}
@@ -129,10 +143,10 @@ def extract_content_dates(soup: BeautifulSoup, head_request_func, url: str, time
     published = None; modified = None
     sel = [
         ("meta", {"property": "article:published_time"}, "content"),
-        ("meta", {"name": re.compile(r"date|dc.date|dcterms\.created", re.I)}, "content"),
-        ("time", {"itemprop": re.compile(r"datePublished|dateCreated", re.I)}, "datetime"),
+        ("meta", {"name": _DATE_META_NAME_RE}, "content"),
+        ("time", {"itemprop": _PUBLISHED_ITEMPROP_RE}, "datetime"),
         ("meta", {"property": "article:modified_time"}, "content"),
-        ("time", {"itemprop": re.compile(r"dateModified", re.I)}, "datetime"),
+        ("time", {"itemprop": _MODIFIED_ITEMPROP_RE}, "datetime"),
     ]
     for tag, attrs, attr_name in sel:
         for el in soup.find_all(tag, attrs=attrs):
@@ -159,8 +173,8 @@ def extract_content_dates(soup: BeautifulSoup, head_request_func, url: str, time
     }
 
 
-def analyze_forms(soup: BeautifulSoup) -> dict:
-    forms = soup.find_all('form')
+def analyze_forms(dom: DomIndex) -> dict:
+    forms = dom.tags('form')
     inputs = sum(len(f.find_all(['input','select','textarea'])) for f in forms)
     return {
         'formCount': len(forms),
@@ -1,8 +1,14 @@
+import copy
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from bs4 import BeautifulSoup
 from ..base_module import SEOModule
 from .text_utils import extract_visible_text
+from .dom_index import DomIndex
 from .title_meta import check_title, check_meta_description
-from .headings_links_images import check_headings, check_images, check_links
+from .headings_links_images import ProbeStatusCache, check_headings, check_images, check_links
 from .advanced import (
     analyze_keyword_placement,
     check_url_slug_quality,
@@ -18,8 +24,7 @@ from .social_misc import (
     check_apple_touch_icon,
     check_script_and_css_files,
     check_strong_tags,
-    check_open_graph,
-    check_twitter_cards,
+    check_social_meta,
     check_seo_friendly_url,
     check_inline_css,
     check_deprecated_html_tags,
@@ -28,6 +33,25 @@ from .social_misc import (
     check_frameset,
 )
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _result_cache_key(url: str) -> str:
+    # Spellings of the same page (host case, default port, fragment, query order) share one entry
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    userinfo = parts.netloc.rpartition("@")[0]
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
 
 class OnPageAnalyzer(SEOModule):
     """Analyzes on-page SEO elements of a given URL."""
@@ -41,20 +65,47 @@ class OnPageAnalyzer(SEOModule):
         self.content_min_words = self.config.get("content_min_words", 300)
         self.links_min_count = self.config.get("links_min_count", 5)
         self.active_check_limit = self.config.get("active_check_limit", 10)
+        self.image_check_workers = self.config.get("image_check_workers", 8)
+        self.link_check_workers = self.config.get("link_check_workers", 16)
         self.url_max_length = self.config.get("url_max_length", 100)
         self.url_max_depth = self.config.get("url_max_depth", 4)
         self.target_keywords = self.config.get("target_keywords", [])
+        # Completed results keyed by normalized URL, so duplicate URLs in a crawl batch are analyzed once
+        # (opt-in; 0 disables)
+        self.result_cache_size = int(self.config.get("result_cache_size", 0))
+        self._result_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # HEAD-probe statuses shared by this analyzer's pages only (one site audit builds one analyzer)
+        self.probe_cache = ProbeStatusCache()
 
-        self.deprecated_tags = [
+        self.deprecated_tags = frozenset([
             "applet", "acronym", "bgsound", "dir", "frame", "frameset",
             "noframes", "isindex", "listing", "xmp", "nextid", "plaintext",
             "rb", "rtc", "strike", "basefont", "big", "blink", "center",
             "font", "marquee", "multicol", "nobr", "spacer", "tt"
-        ]
+        ])
+
+    def cache_clear(self) -> None:
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        self.probe_cache.clear()
+
+    def analyze(self, url: str, soup: BeautifulSoup | None = None) -> dict:
+        # `soup` lets callers that already fetched and parsed the page (e.g. the site audit) skip the fetch.
+        # A supplied soup is fresher than anything cached, so the result cache is bypassed for it.
+        cache_key = _result_cache_key(url) if self.result_cache_size > 0 and soup is None else None
+        if cache_key is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                # Deep copies on the way in and out, so callers never share nested sections with the cache
+                return {self.module_name: {**copy.deepcopy(cached), "url": url}}
 
-    def analyze(self, url: str) -> dict:
         results = {"on_page_analysis_status": "pending", "url": url, "isLoaded": False}
-        soup = self.fetch_html(url)
+        if soup is None:
+            soup = self.fetch_html(url)
         if not soup:
             results["on_page_analysis_status"] = "failed_to_fetch_html"
             results["error_message"] = f"Could not retrieve or parse HTML from {url}"
@@ -62,38 +113,50 @@ class OnPageAnalyzer(SEOModule):
 
         results["isLoaded"] = True
         visible_text = extract_visible_text(soup)
+        # One traversal feeds the element-level checks below
+        dom = DomIndex(soup)
 
-        # Core checks
-        results.update(check_title(soup, self.title_min_len, self.title_max_len, self.target_keywords))
-        results.update(check_meta_description(soup, self.desc_min_len, self.desc_max_len, self.target_keywords))
+        request_timeout = self.global_config.get("request_timeout", 10)
         primary_kw = self.target_keywords[0] if self.target_keywords else None
-        results.update(check_headings(soup, primary_kw))
-        results.update(check_images(soup, url, self.headers, self.global_config.get("request_timeout", 10), self.active_check_limit))
-        results.update(check_links(soup, url, self.headers, self.global_config.get("request_timeout", 10), self.active_check_limit, self.links_min_count))
-        results.update(check_content_stats(visible_text, soup, self.content_min_words))
-        results.update(check_iframes(soup))
-        results.update(check_apple_touch_icon(soup, url))
-        results.update(check_script_and_css_files(soup))
-        results.update(check_strong_tags(soup))
-        results.update(check_open_graph(soup))
-        results.update(check_twitter_cards(soup))
-
-        # Additional checks
-        results.update(check_seo_friendly_url(url, self.url_max_length, self.url_max_depth))
-        results.update(check_inline_css(soup))
-        results.update(check_deprecated_html_tags(soup, self.deprecated_tags))
-        results.update(check_flash_content(soup))
-        results.update(check_nested_tables(soup))
-        results.update(check_frameset(soup))
-
-        # Advanced keyword placement & URL slug quality
-        results.update(analyze_keyword_placement(soup, visible_text, self.target_keywords))
-        results.update(check_url_slug_quality(url, primary_kw))
-        results.update(analyze_images_keywords(soup, primary_kw))
-        results.update(detect_breadcrumbs(soup))
-        results.update(detect_share_buttons(soup))
-        results.update(extract_content_dates(soup, self.head, url, self.global_config.get("request_timeout", 10)))
-        results.update(analyze_forms(soup))
+        # The network-bound checks (HEAD probes) run in the background while the DOM checks
+        # below execute; sections are merged in their original order to keep report keys stable.
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            images_future = ex.submit(check_images, dom, url, self.headers, request_timeout, self.active_check_limit,
+                                      session=self.session, max_workers=self.image_check_workers, probe_cache=self.probe_cache)
+            links_future = ex.submit(check_links, dom, url, self.headers, request_timeout, self.active_check_limit, self.links_min_count,
+                                     session=self.session, max_workers=self.link_check_workers, probe_cache=self.probe_cache)
+            dates_future = ex.submit(extract_content_dates, soup, self.head, url, request_timeout)
+            sections = [
+                # Core checks
+                check_title(soup, self.title_min_len, self.title_max_len, self.target_keywords),
+                check_meta_description(soup, self.desc_min_len, self.desc_max_len, self.target_keywords),
+                check_headings(dom, primary_kw),
+                images_future,
+                links_future,
+                check_content_stats(visible_text, dom, self.content_min_words),
+                check_iframes(dom),
+                check_apple_touch_icon(dom, url),
+                check_script_and_css_files(dom),
+                check_strong_tags(dom),
+                check_social_meta(dom),
+                # Additional checks
+                check_seo_friendly_url(url, self.url_max_length, self.url_max_depth),
+                check_inline_css(dom),
+                check_deprecated_html_tags(dom, self.deprecated_tags),
+                check_flash_content(dom),
+                check_nested_tables(dom),
+                check_frameset(dom),
+                # Advanced keyword placement & URL slug quality
+                analyze_keyword_placement(soup, visible_text, self.target_keywords),
+                check_url_slug_quality(url, primary_kw),
+                analyze_images_keywords(dom, primary_kw),
+                detect_breadcrumbs(soup),
+                detect_share_buttons(dom),
+                dates_future,
+                analyze_forms(dom),
+            ]
+            for section in sections:
+                results.update(section.result() if isinstance(section, Future) else section)
 
         results["on_page_analysis_status"] = "completed"
         # Provide optional text sample and simple hash for site-wide duplicate detection
@@ -104,4 +167,10 @@ class OnPageAnalyzer(SEOModule):
             results["visibleTextHash"] = hashlib.md5(sample.encode('utf-8', errors='ignore')).hexdigest()
         except Exception:
             pass
+        if cache_key is not None:
+            cached = copy.deepcopy(results)
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = cached
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
         return {self.module_name: results}
@@ -0,0 +1,49 @@
+from collections import defaultdict
+from bs4 import BeautifulSoup, Tag
+
+
+class DomIndex:
+    """Elements of a parsed page grouped by tag name, collected in one tree walk.
+
+    On-page checks read from this index instead of each running their own
+    `find_all` over the whole document. Lists keep document order.
+    """
+
+    __slots__ = ("by_tag", "inline_css_count", "has_nested_tables")
+
+    def __init__(self, soup: BeautifulSoup):
+        by_tag = defaultdict(list)
+        inline_css_count = 0
+        has_nested_tables = False
+        # Each frame is (children iterator, whether the frame's element is a <table>)
+        stack = [(iter(soup.contents), False)]
+        open_tables = 0
+        while stack:
+            children, _ = stack[-1]
+            for node in children:
+                if not isinstance(node, Tag):
+                    continue
+                name = node.name
+                by_tag[name].append(node)
+                if node.attrs.get("style") is not None:
+                    inline_css_count += 1
+                is_table = name == "table"
+                if is_table:
+                    if open_tables:
+                        has_nested_tables = True
+                    open_tables += 1
+                if node.contents:
+                    stack.append((iter(node.contents), is_table))
+                    break
+                if is_table:
+                    open_tables -= 1
+            else:
+                _, was_table = stack.pop()
+                if was_table:
+                    open_tables -= 1
+        self.by_tag = by_tag
+        self.inline_css_count = inline_css_count
+        self.has_nested_tables = has_nested_tables
+
+    def tags(self, name: str) -> list[Tag]:
+        return self.by_tag.get(name, [])
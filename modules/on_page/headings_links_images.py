@@ -1,17 +1,115 @@
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
 import requests
+from bs4 import CData, NavigableString, Tag
+from .dom_index import DomIndex
 
-GENERIC_ANCHORS = set([
+GENERIC_ANCHORS = frozenset([
     'click here','read more','learn more','more','here','this link','link','see more','details','view more','check this','visit'
 ])
+# Anchors longer than this can't be generic, so their text never needs building
+_GENERIC_ANCHOR_MAX_LEN = max(map(len, GENERIC_ANCHORS))
+# String classes included by get_text(); a lone comment child is not anchor text
+_TEXT_TYPES = (NavigableString, CData)
+# rel values that make target="_blank" safe against reverse tabnabbing
+SAFE_BLANK_RELS = frozenset(("noopener", "noreferrer"))
+# hrefs that never point at a crawlable page
+_SKIP_HREF_PREFIXES = ("#", "mailto:", "tel:", "javascript:")
+# Host portion of an absolute http(s) URL, as urlparse() would report it in netloc
+_ABS_NETLOC_RE = re.compile(r"https?://([^/?#]*)")
 
-def check_headings(soup: BeautifulSoup, primary_keyword: str | None = None) -> dict:
-    headings_data = {"h1": [], "h2": [], "h3": [], "h4": [], "h5": [], "h6": []}
-    for i in range(1, 7):
-        for h_tag in soup.find_all(f"h{i}"):
-            headings_data[f"h{i}"].append(h_tag.get_text(strip=True))
+
+def _plain_absolute_netloc(url: str) -> str | None:
+    """Host of an absolute http(s) URL that urljoin() would return unchanged, else None.
+
+    urljoin() rebuilds absolute URLs, dropping an empty fragment, query or ;params (so
+    "https://x/a#" becomes "https://x/a") and removing tabs/newlines; such URLs take the slow path.
+    """
+    m = _ABS_NETLOC_RE.match(url)
+    if m and m.group(1) and "#" not in url and ";" not in url and not url.endswith("?") and url.isprintable():
+        return m.group(1)
+    return None
+
+class ProbeStatusCache:
+    """URL -> HTTP status of HEAD probes, so navigation/footer links shared by every page of one
+    analyzer's run (e.g. one site audit) are only probed once. Owned by the analyzer rather than the
+    process, so statuses never carry over between unrelated audits. Timeouts and request errors
+    are not cached."""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._statuses: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> int | None:
+        with self._lock:
+            status = self._statuses.get(url)
+            if status is not None:
+                self._statuses.move_to_end(url)
+            return status
+
+    def put(self, url: str, status: int) -> None:
+        with self._lock:
+            self._statuses[url] = status
+            if len(self._statuses) > self.max_size:
+                self._statuses.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statuses.clear()
+
+
+def _probe_status(url: str, headers: dict, request_timeout: int, session: requests.Session | None = None,
+                  probe_cache: ProbeStatusCache | None = None):
+    """HEAD a URL and return its status code, or "timeout"/"request_error"."""
+    if probe_cache is not None:
+        status = probe_cache.get(url)
+        if status is not None:
+            return status
+    http = session or requests
+    try:
+        status = http.head(url, timeout=request_timeout / 2, allow_redirects=True, headers=headers).status_code
+    except requests.exceptions.Timeout:
+        return "timeout"
+    except requests.exceptions.RequestException:
+        return "request_error"
+    if probe_cache is not None:
+        probe_cache.put(url, status)
+    return status
+
+
+def _check_url_status(url: str, headers: dict, request_timeout: int, session: requests.Session | None = None,
+                      probe_cache: ProbeStatusCache | None = None) -> dict | None:
+    """Return a broken-resource detail dict for `url`, or None if it responds below 400."""
+    status = _probe_status(url, headers, request_timeout, session, probe_cache)
+    if isinstance(status, int) and status < 400:
+        return None
+    return {"url": url, "status_code": status}
+
+
+def _check_urls(urls: list[str], headers: dict, request_timeout: int, session: requests.Session | None, max_workers: int,
+                probe_cache: ProbeStatusCache | None = None) -> list[dict]:
+    """HEAD-check URLs concurrently; HEADs are latency-bound. Results keep the input order."""
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as ex:
+        results = ex.map(lambda u: _check_url_status(u, headers, request_timeout, session, probe_cache), urls)
+        return [r for r in results if r]
+
+def _stripped_text_len(tag: Tag) -> int:
+    # len(tag.get_text(" ", strip=True)) without building the joined string
+    total = count = 0
+    for s in tag.stripped_strings:
+        total += len(s)
+        count += 1
+    return total + count - 1 if count else 0
+
+def check_headings(dom: DomIndex, primary_keyword: str | None = None) -> dict:
+    headings_data = {f"h{i}": [h_tag.get_text(strip=True) for h_tag in dom.tags(f"h{i}")] for i in range(1, 7)}
     h1_content_list = headings_data["h1"]
     h1_count = len(h1_content_list)
     h1_contains_kw = False
@@ -47,29 +145,26 @@ def check_headings(soup: BeautifulSoup, primary_keyword: str | None = None) -> d
         "headingHierarchyValid": hierarchy_valid,
     }
 
-def check_images(soup: BeautifulSoup, base_url: str, headers: dict, request_timeout: int, active_check_limit: int) -> dict:
-    images = soup.find_all("img")
+def check_images(dom: DomIndex, base_url: str, headers: dict, request_timeout: int, active_check_limit: int,
+                 session: requests.Session | None = None, max_workers: int = 8,
+                 probe_cache: ProbeStatusCache | None = None) -> dict:
+    images = dom.tags("img")
     not_optimized_imgs_src = []
     broken_images_details = []
     responsive_image_issues = []
     aspect_ratio_issues = []  # Placeholder
 
-    images_to_actively_check = images[:active_check_limit]
+    # Resolve lazily and dedupe so repeated sprites/logos are probed once
+    image_urls = dict.fromkeys(
+        src if _plain_absolute_netloc(src) else urljoin(base_url, src)
+        for src in (img.get("src") for img in images)
+        if src and not src.startswith(('data:', 'blob:'))
+    )
+    images_to_actively_check = list(islice(image_urls, active_check_limit))
 
     if images_to_actively_check:
         print(f"Actively checking up to {len(images_to_actively_check)} images for broken status (total on page: {len(images)})...")
-        for img_tag in images_to_actively_check:
-            src = img_tag.get("src")
-            if src and not src.startswith(('data:', 'blob:')):
-                full_img_url = urljoin(base_url, src)
-                try:
-                    response = requests.head(full_img_url, timeout=request_timeout / 2, allow_redirects=True, headers=headers)
-                    if response.status_code >= 400:
-                        broken_images_details.append({"url": full_img_url, "status_code": response.status_code})
-                except requests.exceptions.Timeout:
-                    broken_images_details.append({"url": full_img_url, "status_code": "timeout"})
-                except requests.exceptions.RequestException:
-                    broken_images_details.append({"url": full_img_url, "status_code": "request_error"})
+        broken_images_details = _check_urls(images_to_actively_check, headers, request_timeout, session, max_workers, probe_cache)
 
     for img in images:
         alt_text = img.get("alt", "").strip()
@@ -98,7 +193,9 @@ def check_images(soup: BeautifulSoup, base_url: str, headers: dict, request_time
         "imageAspectRatioIssuesCount": len(aspect_ratio_issues),
     }
 
-def check_links(soup: BeautifulSoup, base_url: str, headers: dict, request_timeout: int, active_check_limit: int, links_min_count: int) -> dict:
+def check_links(dom: DomIndex, base_url: str, headers: dict, request_timeout: int, active_check_limit: int, links_min_count: int,
+                session: requests.Session | None = None, max_workers: int = 16,
+                probe_cache: ProbeStatusCache | None = None) -> dict:
     internal_links_list = []
     external_links_list = []
     internal_nofollow_links_list = []
@@ -111,22 +208,42 @@ def check_links(soup: BeautifulSoup, base_url: str, headers: dict, request_timeo
     generic_anchor_count = 0
     base_domain = urlparse(base_url).netloc
 
-    all_a_tags = soup.find_all("a", href=True)
-
-    for a_tag in all_a_tags:
-        href = a_tag["href"]
-        anchor_text = a_tag.get_text(strip=True)
-        if not href or href.startswith(("#", "mailto:", "tel:", "javascript:")):
+    for a_tag in dom.tags("a"):
+        # Read the attribute dict directly; Tag.get/__getitem__ add a Python call per lookup.
+        attrs = a_tag.attrs
+        href = attrs.get("href")
+        if not href or href.startswith(_SKIP_HREF_PREFIXES):
             continue
-        full_url = urljoin(base_url, href)
-        link_domain = urlparse(full_url).netloc
-        rel_vals = a_tag.get("rel", []) or []
+        # Most anchors wrap a single string; otherwise measure the text and only build it
+        # when it is short enough to be one of the generic phrases.
+        anchor_string = a_tag.string
+        if anchor_string is not None and type(anchor_string) in _TEXT_TYPES:
+            anchor_text = anchor_string.strip()
+            anchor_len = len(anchor_text)
+        else:
+            anchor_text = None
+            anchor_len = _stripped_text_len(a_tag)
+        # Classify the host without a full urlparse for the common absolute and root/dot-relative forms
+        link_domain = _plain_absolute_netloc(href)
+        if link_domain:
+            full_url = href
+        elif href[0] in "/.?" and not href.startswith("//"):
+            full_url = urljoin(base_url, href)
+            link_domain = base_domain
+        else:
+            full_url = urljoin(base_url, href)
+            link_domain = urlparse(full_url).netloc
+        rel_vals = attrs.get("rel") or []
+        target = attrs.get("target")
         is_nofollow = "nofollow" in rel_vals
-        if anchor_text:
-            total_anchor_text_length += len(anchor_text)
+        if anchor_len:
+            total_anchor_text_length += anchor_len
             valid_links_for_anchor_avg += 1
-            if anchor_text.lower().strip() in GENERIC_ANCHORS:
-                generic_anchor_count += 1
+            if anchor_len <= _GENERIC_ANCHOR_MAX_LEN:
+                if anchor_text is None:
+                    anchor_text = a_tag.get_text(" ", strip=True)
+                if anchor_text.lower() in GENERIC_ANCHORS:
+                    generic_anchor_count += 1
         if link_domain == base_domain:
             internal_links_list.append(full_url)
             if is_nofollow:
@@ -134,27 +251,20 @@ def check_links(soup: BeautifulSoup, base_url: str, headers: dict, request_timeo
             internal_links_detailed.append({
                 "url": full_url,
                 "rel": rel_vals,
-                "target": a_tag.get("target"),
+                "target": target,
             })
         else:
             external_links_list.append(full_url)
-            if a_tag.get("target") == "_blank" and not ("noopener" in a_tag.get("rel", []) or "noreferrer" in a_tag.get("rel", [])):
+            if target == "_blank" and SAFE_BLANK_RELS.isdisjoint(rel_vals):
                 unsafe_cross_origin_links.append(full_url)
 
     all_discovered_links = internal_links_list + external_links_list
-    links_to_actively_check = all_discovered_links[:active_check_limit]
+    # Pages often repeat the same link (nav, footer); probe each URL once
+    links_to_actively_check = list(islice(dict.fromkeys(all_discovered_links), active_check_limit))
 
     if links_to_actively_check:
         print(f"Actively checking up to {len(links_to_actively_check)} links for broken status (total on page: {len(all_discovered_links)})...")
-        for link_url_to_check in links_to_actively_check:
-            try:
-                response = requests.head(link_url_to_check, timeout=request_timeout / 2, allow_redirects=True, headers=headers)
-                if response.status_code >= 400:
-                    broken_links_details.append({"url": link_url_to_check, "status_code": response.status_code})
-            except requests.exceptions.Timeout:
-                broken_links_details.append({"url": link_url_to_check, "status_code": "timeout"})
-            except requests.exceptions.RequestException:
-                broken_links_details.append({"url": link_url_to_check, "status_code": "request_error"})
+        broken_links_details = _check_urls(links_to_actively_check, headers, request_timeout, session, max_workers, probe_cache)
 
     links_count_total = len(all_discovered_links)
     avg_anchor_len = (total_anchor_text_length / valid_links_for_anchor_avg) if valid_links_for_anchor_avg > 0 else 0
@@ -1,13 +1,24 @@
 import re
 from urllib.parse import urljoin, urlparse, unquote
-from bs4 import BeautifulSoup
+from .dom_index import DomIndex
+from .text_utils import count_words
 
-def check_content_stats(page_text_content: str, soup: BeautifulSoup, content_min_words: int) -> dict:
-    import re as _re
-    words = _re.findall(r'\b\w+\b', page_text_content.lower())
-    word_count = len(words)
-    paragraphs_count = len(soup.find_all("p"))
-    has_lorem_ipsum = "lorem ipsum" in page_text_content.lower()
+_RE_LOREM = re.compile(r"lorem ipsum", re.I)
+_RE_APPLE_TOUCH = re.compile(r"apple-touch-icon", re.I)
+_RE_OG = re.compile(r"^og:", re.I)
+_RE_TWITTER = re.compile(r"^twitter:", re.I)
+_RE_URL_EXT = re.compile(r"\.(php|asp|aspx|jsp|html|htm)$")
+_RE_FLASH_TYPE = re.compile(r'application/x-shockwave-flash', re.I)
+_RE_FLASH_CLSID = re.compile(r'clsid:D27CDB6E-AE6D-11cf-96B8-444553540000', re.I)
+
+def _attr_text(value) -> str:
+    # Multi-valued attributes (rel, class) parse to lists; find_all also matches their joined form
+    return " ".join(value) if isinstance(value, list) else (value or "")
+
+def check_content_stats(page_text_content: str, dom: DomIndex, content_min_words: int) -> dict:
+    word_count = count_words(page_text_content)
+    paragraphs_count = len(dom.tags("p"))
+    has_lorem_ipsum = _RE_LOREM.search(page_text_content) is not None
     return {
         "wordsCount": word_count,
         "isContentEnoughLong": word_count >= content_min_words,
@@ -15,48 +26,48 @@ def check_content_stats(page_text_content: str, soup: BeautifulSoup, content_min
         "loremIpsum": has_lorem_ipsum,
     }
 
-def check_iframes(soup: BeautifulSoup) -> dict:
-    iframes = soup.find_all("iframe")
+def check_iframes(dom: DomIndex) -> dict:
+    iframes = dom.tags("iframe")
     return {"isNotIframe": len(iframes) == 0, "iframes": len(iframes)}
 
-def check_apple_touch_icon(soup: BeautifulSoup, base_url: str) -> dict:
-    import re as _re
-    icon_tag = soup.find("link", rel=_re.compile(r"apple-touch-icon", _re.I))
+def check_apple_touch_icon(dom: DomIndex, base_url: str) -> dict:
+    icon_tag = next((t for t in dom.tags("link") if _RE_APPLE_TOUCH.search(_attr_text(t.get("rel")))), None)
     icon_url = urljoin(base_url, icon_tag["href"]) if icon_tag and icon_tag.get("href") else None
     return {"appleTouchIcon": bool(icon_url), "appleTouchIconUrl": icon_url}
 
-def check_script_and_css_files(soup: BeautifulSoup) -> dict:
-    js_files = len(soup.find_all("script", src=True))
-    css_files = len(soup.find_all("link", rel="stylesheet", href=True))
+def check_script_and_css_files(dom: DomIndex) -> dict:
+    js_files = sum(1 for t in dom.tags("script") if t.get("src") is not None)
+    css_files = sum(
+        1 for t in dom.tags("link")
+        if t.get("href") is not None and "stylesheet" in (t.get("rel") or ())
+    )
     return {"javascriptFiles": js_files, "cssFiles": css_files}
 
-def check_strong_tags(soup: BeautifulSoup) -> dict:
-    strong_tags = len(soup.find_all("strong"))
-    b_tags = len(soup.find_all("b"))
+def check_strong_tags(dom: DomIndex) -> dict:
+    strong_tags = len(dom.tags("strong"))
+    b_tags = len(dom.tags("b"))
     return {"strongTags": strong_tags + b_tags}
 
-def check_open_graph(soup: BeautifulSoup) -> dict:
-    import re as _re
+def check_social_meta(dom: DomIndex) -> dict:
+    # Open Graph and Twitter Card tags gathered in one pass over the <meta> elements
     og_tags = {}
-    for tag in soup.find_all("meta", attrs={"property": _re.compile(r"^og:", _re.I)}):
-        prop = tag.get("property")
+    twitter_tags = {}
+    for tag in dom.tags("meta"):
         content = tag.get("content")
-        if prop and content:
+        if not content:
+            continue
+        prop = tag.get("property")
+        if prop and _RE_OG.match(_attr_text(prop)):
             og_tags[prop] = content
-    return {"hasOpenGraph": bool(og_tags), "openGraphTags": og_tags}
-
-def check_twitter_cards(soup: BeautifulSoup) -> dict:
-    import re as _re
-    twitter_tags = {}
-    for tag in soup.find_all("meta", attrs={"name": _re.compile(r"^twitter:", _re.I)}):
         name = tag.get("name")
-        content = tag.get("content")
-        if name and content:
+        if name and _RE_TWITTER.match(_attr_text(name)):
             twitter_tags[name] = content
-    return {"hasTwitterCards": bool(twitter_tags), "twitterCardTags": twitter_tags}
+    return {
+        "hasOpenGraph": bool(og_tags), "openGraphTags": og_tags,
+        "hasTwitterCards": bool(twitter_tags), "twitterCardTags": twitter_tags,
+    }
 
 def check_seo_friendly_url(url: str, url_max_length: int, url_max_depth: int) -> dict:
-    import re as _re
     parsed_url = urlparse(url)
     path = unquote(parsed_url.path)
     is_seo_friendly = True
@@ -68,42 +79,33 @@ def check_seo_friendly_url(url: str, url_max_length: int, url_max_depth: int) ->
     if len(path_segments) > url_max_depth:
         is_seo_friendly = False
         issues.append(f"URL path is too deep (>{url_max_depth} segments).")
-    if any(char.isupper() for char in path):
+    lower_path = path.lower()
+    if path != lower_path:
         issues.append("URL path contains uppercase characters. Prefer lowercase.")
-    if _re.search(r"\.(php|asp|aspx|jsp|html|htm)$", path.lower()) and path != "/" and path_segments:
+    if path_segments and path != "/" and _RE_URL_EXT.search(lower_path):
         issues.append("URL contains file extensions. Consider using clean URLs.")
     return {"isSeoFriendlyUrl": is_seo_friendly, "seoFriendlyUrlIssues": issues}
 
-def check_inline_css(soup: BeautifulSoup) -> dict:
-    inline_css_count = 0
-    for tag in soup.find_all(style=True):
-        inline_css_count += 1
+def check_inline_css(dom: DomIndex) -> dict:
+    inline_css_count = dom.inline_css_count
     return {"inlineCssCount": inline_css_count, "hasInlineCss": inline_css_count > 0}
 
-def check_deprecated_html_tags(soup: BeautifulSoup, deprecated_tags: list[str]) -> dict:
-    found_deprecated = {}
-    for dep_tag_name in deprecated_tags:
-        tags = soup.find_all(dep_tag_name)
-        if tags:
-            found_deprecated[dep_tag_name] = len(tags)
+def check_deprecated_html_tags(dom: DomIndex, deprecated_tags: frozenset[str]) -> dict:
+    # One membership test per distinct tag name on the page; keys follow document order
+    found_deprecated = {name: len(tags) for name, tags in dom.by_tag.items() if name in deprecated_tags}
     return {"deprecatedHtmlTagsFound": found_deprecated, "hasDeprecatedHtmlTags": bool(found_deprecated)}
 
-def check_flash_content(soup: BeautifulSoup) -> dict:
-    import re as _re
-    flash_objects = soup.find_all(['object', 'embed'], attrs={'type': _re.compile(r'application/x-shockwave-flash', _re.I)})
-    flash_objects_classid = soup.find_all('object', attrs={'classid': _re.compile(r'clsid:D27CDB6E-AE6D-11cf-96B8-444553540000', _re.I)})
-    has_flash = bool(flash_objects or flash_objects_classid)
+def check_flash_content(dom: DomIndex) -> dict:
+    has_flash = (
+        any(_RE_FLASH_TYPE.search(_attr_text(t.get('type'))) for t in dom.tags('object') + dom.tags('embed') if t.get('type') is not None)
+        or any(_RE_FLASH_CLSID.search(_attr_text(t.get('classid'))) for t in dom.tags('object') if t.get('classid') is not None)
+    )
     return {"hasFlashContent": has_flash}
 
-def check_nested_tables(soup: BeautifulSoup) -> dict:
-    nested = False
-    for table in soup.find_all('table'):
-        if table.find('table'):
-            nested = True
-            break
-    return {"hasNestedTables": nested}
+def check_nested_tables(dom: DomIndex) -> dict:
+    return {"hasNestedTables": dom.has_nested_tables}
 
-def check_frameset(soup: BeautifulSoup) -> dict:
-    frameset = bool(soup.find('frameset') or soup.find('frame'))
+def check_frameset(dom: DomIndex) -> dict:
+    frameset = bool(dom.tags('frameset') or dom.tags('frame'))
     return {"hasFrameset": frameset}
 
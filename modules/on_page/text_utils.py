@@ -1,10 +1,36 @@
-from bs4 import BeautifulSoup, Comment
+import re
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# Subtrees whose text is not part of the visible page content
+_SKIP_TEXT_TAGS = frozenset(["script", "style", "nav", "footer", "aside", "header", "noscript"])
+# String classes get_text() keeps by default (comments, doctypes, etc. are excluded)
+_TEXT_TYPES = (NavigableString, CData)
 
 def extract_visible_text(soup: BeautifulSoup) -> str:
-    text_soup = BeautifulSoup(str(soup), 'html.parser')
-    for element in text_soup(["script", "style", "nav", "footer", "aside", "header", "noscript"]):
-        element.decompose()
-    for comment in text_soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-    return text_soup.get_text(separator=" ", strip=True)
+    # Single read-only walk that prunes skipped subtrees; equivalent to
+    # get_text(separator=" ", strip=True) on a copy with those subtrees removed.
+    parts = []
+    stack = [iter(soup.contents)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag):
+                if node.name not in _SKIP_TEXT_TAGS:
+                    stack.append(iter(node.contents))
+                    break
+            elif type(node) in _TEXT_TYPES:
+                text = node.strip()
+                if text:
+                    parts.append(text)
+        else:
+            stack.pop()
+    return " ".join(parts)
+
+
+_WORD_RUN_RE = re.compile(r"\w+")
 
+def count_words(text: str) -> int:
+    # Number of \w+ runs (same as len(re.findall(r"\b\w+\b", text))), counted without
+    # building the list of words
+    if not text:
+        return 0
+    return sum(1 for _ in _WORD_RUN_RE.finditer(text))
@@ -1,5 +1,5 @@
 import re
-from collections import Counter
+from functools import lru_cache
 from bs4 import BeautifulSoup
 
 # Approximate pixel width using simple per-character weights (heuristic)
@@ -11,29 +11,45 @@ _CHAR_PX = {
     'A': 9, 'B': 10, 'C': 10, 'D': 10, 'E': 9, 'F': 9, 'G': 10, 'H': 10, 'K': 10, 'L': 9, 'M': 12, 'N': 10, 'O': 10, 'P': 10, 'Q': 10, 'R': 10, 'S': 9, 'T': 9, 'U': 10, 'V': 10, 'W': 12, 'X': 10, 'Y': 10, 'Z': 9,
 }
 
+# Latin-1 lookup table built from _CHAR_PX (falling back to the lowercase width, then 9px)
+_PX_TABLE = bytes(
+    _CHAR_PX.get(chr(b), _CHAR_PX.get(chr(b).lower(), 9)) for b in range(256)
+)
+
 def _estimate_pixels(text: str) -> int:
     if not text:
         return 0
-    total = 0
-    for ch in text:
-        total += _CHAR_PX.get(ch, _CHAR_PX.get(ch.lower(), 9))
-    return total
+    # Characters outside Latin-1 become '?', which carries the default 9px width
+    return sum(text.encode("latin-1", "replace").translate(_PX_TABLE))
 
 POWER_WORDS = set([
     'ultimate','proven','best','top','essential','secret','exclusive','easy','quick','simple','step-by-step','definitive','complete','powerful','effective','free','instant','guaranteed','new','now','today'
 ])
 
+def _phrase_alternation(phrases) -> re.Pattern:
+    # One case-insensitive pass equivalent to `any(p in text.lower() for p in phrases)`
+    return re.compile("|".join(re.escape(p) for p in phrases), re.I)
+
+_POWER_WORDS_RE = _phrase_alternation(POWER_WORDS)
+
 def _has_power_words(text: str) -> bool:
     if not text:
         return False
-    low = text.lower()
-    return any(pw in low for pw in POWER_WORDS)
+    return _POWER_WORDS_RE.search(text) is not None
 
-def _keyword_near_start(title: str, primary_kw: str, pos_threshold: int = 20) -> bool:
-    if not title or not primary_kw:
-        return False
-    idx = title.lower().find(primary_kw.lower())
-    return idx != -1 and idx <= pos_threshold
+_KEYWORD_NEAR_START_CHARS = 20
+_WORD_RE = re.compile(r'\b\w+\b')
+_DESC_NAME_RE = re.compile(r"^description$", re.I)
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(primary_kw: str) -> re.Pattern:
+    # Whole-word match so e.g. "seo" does not match inside "season"
+    return re.compile(rf"(?<!\w){re.escape(primary_kw)}(?!\w)", re.I)
+
+def _keyword_match(text: str | None, primary_kw: str | None) -> re.Match | None:
+    if not text or not primary_kw:
+        return None
+    return _keyword_pattern(primary_kw).search(text)
 
 def check_title(soup: BeautifulSoup, title_min_len: int, title_max_len: int, target_keywords: list[str] | None = None) -> dict:
     title_tags = soup.find_all("title")
@@ -52,13 +68,20 @@ def check_title(soup: BeautifulSoup, title_min_len: int, title_max_len: int, tar
 
     duplicate_words_count = 0
     if title_text:
-        words = re.findall(r'\b\w+\b', title_text.lower())
-        counts = Counter(words)
-        duplicate_words_count = sum(1 for word, count in counts.items() if count > 1 and len(word) > 2)
+        # Count each repeated word (longer than 2 chars) once, as it hits its second occurrence
+        counts = {}
+        for word in _WORD_RE.findall(title_text.lower()):
+            if len(word) <= 2:
+                continue
+            c = counts.get(word, 0) + 1
+            counts[word] = c
+            if c == 2:
+                duplicate_words_count += 1
 
     primary_kw = (target_keywords[0].strip() if target_keywords else None) or None
-    has_primary_kw = bool(primary_kw and title_text and primary_kw.lower() in title_text.lower())
-    near_start = _keyword_near_start(title_text or '', primary_kw or '') if has_primary_kw else False
+    kw_match = _keyword_match(title_text, primary_kw)
+    has_primary_kw = kw_match is not None
+    near_start = has_primary_kw and kw_match.start() <= _KEYWORD_NEAR_START_CHARS
     has_brand = False
     if title_text and ("|" in title_text or " - " in title_text):
         # Heuristic: text after last delimiter looks like brand
@@ -84,14 +107,15 @@ CTA_PHRASES = set([
     'learn more','read more','buy now','shop now','get started','try now','sign up','contact us','book now','download','discover','find out','see how','start now','join now','request a quote','subscribe'
 ])
 
+_CTA_RE = _phrase_alternation(CTA_PHRASES)
+
 def _has_cta(text: str) -> bool:
     if not text:
         return False
-    low = text.lower()
-    return any(phrase in low for phrase in CTA_PHRASES)
+    return _CTA_RE.search(text) is not None
 
 def check_meta_description(soup: BeautifulSoup, desc_min_len: int, desc_max_len: int, target_keywords: list[str] | None = None) -> dict:
-    meta_desc_tags = soup.find_all("meta", attrs={"name": re.compile(r"^description$", re.I)})
+    meta_desc_tags = soup.find_all("meta", attrs={"name": _DESC_NAME_RE})
     meta_desc_tag = meta_desc_tags[0] if meta_desc_tags else None
     meta_desc_text = meta_desc_tag.get("content", "").strip() if meta_desc_tag else None
     meta_desc_length = len(meta_desc_text) if meta_desc_text else 0
@@ -106,7 +130,7 @@ def check_meta_description(soup: BeautifulSoup, desc_min_len: int, desc_max_len:
         status = "too_long"
 
     primary_kw = (target_keywords[0].strip() if target_keywords else None) or None
-    meta_has_primary_kw = bool(primary_kw and meta_desc_text and primary_kw.lower() in meta_desc_text.lower())
+    meta_has_primary_kw = _keyword_match(meta_desc_text, primary_kw) is not None
 
     return {
         "metaDescription": meta_desc_text,
@@ -1,11 +1,18 @@
+import warnings
+
 from ..base_module import SEOModule
-from .weights import DEFAULT_WEIGHTS
-from .util import add_score as _add_score
+from .weights import DEFAULT_WEIGHTS, RULE_NAMES
+from .util import EMPTY_DICT, Scorecard, add_score as _add_score, compile_weights
 from .on_page import score_on_page
 from .technical import score_technical
 from .content import score_content
 
 
+# category_weights names -> result key prefixes, matched case-insensitively with underscores
+# ignored, so "OnPage", "onpage" and "on_page" all name the On-Page category
+_CATEGORY_KEYS = {"onpage": "on_page", "technical": "technical", "content": "content"}
+
+
 class ScoringModule(SEOModule):
     def __init__(self, config=None):
         super().__init__(config=config)
@@ -20,39 +27,43 @@ class ScoringModule(SEOModule):
                     self.default_weights[key] = value
         if "category_weights" in self.scoring_config:
             self.default_weights["category_weights"].update(self.scoring_config["category_weights"])
+        # Flattened once here; the per-page scorers read points/weight straight from these records
+        self.rules = compile_weights(self.default_weights, RULE_NAMES)
+        # (score key, weight) per weighted category, resolved once. Spellings of the same category
+        # collapse to one entry, so a user's "on_page" overrides the default "OnPage" weight.
+        category_weights = {}
+        for name, weight in self.default_weights["category_weights"].items():
+            prefix = _CATEGORY_KEYS.get(str(name).lower().replace("_", ""))
+            if prefix is None:
+                warnings.warn(f"Unknown scoring category {name!r} in category_weights; it is not counted in the overall score")
+                continue
+            category_weights[f"{prefix}_score_percent"] = weight
+        self._category_items = tuple(category_weights.items())
+        self._category_weight_sum = sum(weight for _, weight in self._category_items)
 
     def analyze(self, url: str, full_report_data: dict = None) -> dict:
         if not full_report_data:
             return {self.module_name: {"scoring_status": "error", "error_message": "No report data."}}
 
-        on_page_data = full_report_data.get("OnPageAnalyzer", {})
-        tech_data = full_report_data.get("TechnicalSEOAnalyzer", {})
-        content_data = full_report_data.get("ContentAnalyzer", {})
+        on_page_data = full_report_data.get("OnPageAnalyzer") or EMPTY_DICT
+        tech_data = full_report_data.get("TechnicalSEOAnalyzer") or EMPTY_DICT
+        content_data = full_report_data.get("ContentAnalyzer") or EMPTY_DICT
 
-        scores = {
-            "on_page": {"earned_points": 0, "max_points": 0, "issues": [], "successes": []},
-            "technical": {"earned_points": 0, "max_points": 0, "issues": [], "successes": []},
-            "content": {"earned_points": 0, "max_points": 0, "issues": [], "successes": []},
-        }
+        scores = {"on_page": Scorecard(), "technical": Scorecard(), "content": Scorecard()}
 
-        score_on_page(on_page_data, scores["on_page"], self.default_weights, _add_score)
-        score_technical(tech_data, scores["technical"], self.default_weights, _add_score)
-        score_content(content_data, scores["content"], self.default_weights, _add_score)
+        score_on_page(on_page_data, scores["on_page"], self.rules, _add_score)
+        score_technical(tech_data, scores["technical"], self.rules, _add_score)
+        score_content(content_data, scores["content"], self.rules, _add_score)
 
         final_scores = {}
         for category, data in scores.items():
-            cat_score = (data["earned_points"] / data["max_points"] * 100) if data["max_points"] > 0 else 0
+            cat_score = (data.earned_points / data.max_points * 100) if data.max_points > 0 else 0
             final_scores[f"{category}_score_percent"] = round(max(0, min(cat_score, 100)), 1)
-            final_scores[f"{category}_issues"] = data["issues"]
-            final_scores[f"{category}_successes"] = data["successes"]
-
-        overall_score = 0; total_weight = 0
-        cat_weights = self.default_weights["category_weights"]
-        for cat_name, weight in cat_weights.items():
-            score_key = f"{cat_name.lower()}_score_percent"
-            if score_key in final_scores and final_scores[score_key] is not None:
-                overall_score += final_scores[score_key] * weight
-                total_weight += weight
+            final_scores[f"{category}_issues"] = data.issues
+            final_scores[f"{category}_successes"] = data.successes
+
+        overall_score = sum(final_scores[score_key] * weight for score_key, weight in self._category_items)
+        total_weight = self._category_weight_sum
         final_scores["overall_seo_score_percent"] = round(overall_score / total_weight, 1) if total_weight > 0 else 0
         final_scores["scoring_status"] = "completed"
         return {self.module_name: final_scores}
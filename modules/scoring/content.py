@@ -1,52 +1,62 @@
-def score_content(data, score_data, weights, add_score):
+from .util import EMPTY_DICT
+
+# Flesch reading-ease bands: (minimum score or None for the rest, share of points, message, is success)
+_READABILITY_BANDS = (
+    (60, 1.0, "Good readability", True),
+    (30, 0.5, "Readability could be improved", False),
+    (None, 0.1, "Very difficult to read", False),
+)
+
+def score_content(data, score_data, rules, add_score):
     if not data or data.get("content_analysis_status") != "completed":
-        score_data["issues"].append("Content: Analysis module did not run or found no content.")
+        score_data.issues.append("Content: Analysis module did not run or found no content.")
         return
+    get = data.get
     # Readability
-    max_p = weights["readability_score"]["max_points"]
-    f_score = data.get("flesch_reading_ease_score")
+    max_p = rules["readability_score"].max_points
+    f_score = get("flesch_reading_ease_score")
     if f_score is not None:
-        if f_score >= 60:
-            add_score(score_data, weights, "readability_score", max_p, success_msg=f"Good readability (Flesch: {f_score}).")
-        elif f_score >= 30:
-            add_score(score_data, weights, "readability_score", max_p * 0.5, issue_msg=f"Readability could be improved (Flesch: {f_score}).")
-        else:
-            add_score(score_data, weights, "readability_score", max_p * 0.1, issue_msg=f"Very difficult to read (Flesch: {f_score}).")
+        for min_score, share, label, is_success in _READABILITY_BANDS:
+            if min_score is None or f_score >= min_score:
+                msg = ("%s (Flesch: %s).", label, f_score)
+                add_score(score_data, rules, "readability_score", max_p * share,
+                          issue_msg=None if is_success else msg, success_msg=msg if is_success else None)
+                break
     else:
-        add_score(score_data, weights, "readability_score", 0, issue_msg="Readability score N/A.")
+        add_score(score_data, rules, "readability_score", 0, issue_msg="Readability score N/A.")
     # Keyword Usage
-    max_p_kw = weights["keyword_usage_score"]["max_points"]
-    kw_usage = data.get("keywordUsage", {})
-    if data.get("target_keywords_analyzed"):
-        found_kws = sum(1 for dets in kw_usage.values() if dets.get("phrase_count", 0) > 0)
-        total_targeted = len(data.get("target_keywords_analyzed", []))
+    max_p_kw = rules["keyword_usage_score"].max_points
+    targeted = get("target_keywords_analyzed")
+    if targeted:
+        found_kws = sum(1 for dets in (get("keywordUsage") or EMPTY_DICT).values() if dets.get("phrase_count", 0) > 0)
+        total_targeted = len(targeted)
         if total_targeted > 0:
-            add_score(score_data, weights, "keyword_usage_score", max_p_kw * (found_kws / total_targeted), issue_msg=f"{total_targeted - found_kws} target keywords missing or low presence.", success_msg="Target keywords effectively used.")
+            add_score(score_data, rules, "keyword_usage_score", max_p_kw * (found_kws / total_targeted), issue_msg=("%s target keywords missing or low presence.", total_targeted - found_kws), success_msg="Target keywords effectively used.")
         else:
-            add_score(score_data, weights, "keyword_usage_score", max_p_kw, success_msg="No specific keywords targeted for usage analysis.")
+            add_score(score_data, rules, "keyword_usage_score", max_p_kw, success_msg="No specific keywords targeted for usage analysis.")
     else:
-        add_score(score_data, weights, "keyword_usage_score", max_p_kw, success_msg="No specific keywords targeted for usage analysis.")
+        add_score(score_data, rules, "keyword_usage_score", max_p_kw, success_msg="No specific keywords targeted for usage analysis.")
     # Most Common Keywords
-    if data.get("mostCommonKeywords"):
-        add_score(score_data, weights, "most_common_keywords_score", weights["most_common_keywords_score"]["max_points"], success_msg="Common keywords identified.")
+    if get("mostCommonKeywords"):
+        add_score(score_data, rules, "most_common_keywords_score", rules["most_common_keywords_score"].max_points, success_msg="Common keywords identified.")
     else:
-        add_score(score_data, weights, "most_common_keywords_score", 0, issue_msg="Could not identify common keywords.")
+        add_score(score_data, rules, "most_common_keywords_score", 0, issue_msg="Could not identify common keywords.")
     # Text-HTML Ratio
-    max_p = weights["text_html_ratio_score"]["max_points"]
-    ratio_stat = data.get("textToHtmlRatioStatus")
-    ratio_val = data.get("textToHtmlRatioPercent")
+    max_p = rules["text_html_ratio_score"].max_points
+    ratio_stat = get("textToHtmlRatioStatus")
+    ratio_val = get("textToHtmlRatioPercent")
     if ratio_stat == "low_ratio":
-        add_score(score_data, weights, "text_html_ratio_score", max_p * 0.2, issue_msg=f"Text-to-HTML ratio low ({ratio_val}%).")
+        add_score(score_data, rules, "text_html_ratio_score", max_p * 0.2, issue_msg=("Text-to-HTML ratio low (%s%%).", ratio_val))
     elif ratio_stat in ("calculated", "high_ratio"):
-        add_score(score_data, weights, "text_html_ratio_score", max_p, success_msg=f"Text-to-HTML ratio is {ratio_val}%.")
+        add_score(score_data, rules, "text_html_ratio_score", max_p, success_msg=("Text-to-HTML ratio is %s%%.", ratio_val))
     else:
-        add_score(score_data, weights, "text_html_ratio_score", 0, issue_msg="Text-to-HTML ratio N/A.")
+        add_score(score_data, rules, "text_html_ratio_score", 0, issue_msg="Text-to-HTML ratio N/A.")
     # Spell Check Penalty
-    spell_check_data = data.get("spellCheck", {})
+    spell_check_data = get("spellCheck") or EMPTY_DICT
     if spell_check_data.get("status") == "completed":
         misspelled_count = spell_check_data.get("misspelled_words_count", 0)
-        penalty = min(weights["spell_check_penalty"]["max_points"], misspelled_count * 0.5)
-        add_score(score_data, weights, "spell_check_penalty", penalty, is_penalty=True, issue_msg=f"{misspelled_count} potential spelling errors found.", success_msg="No significant spelling errors.")
+        penalty = min(rules["spell_check_penalty"].max_points, misspelled_count * 0.5)
+        add_score(score_data, rules, "spell_check_penalty", penalty, issue_msg=("%s potential spelling errors found.", misspelled_count), success_msg="No significant spelling errors.")
     elif spell_check_data.get("status") == "skipped_pyspellchecker_not_installed":
-        add_score(score_data, weights, "spell_check_penalty", 0, is_penalty=True, issue_msg="Spell check skipped (pyspellchecker not installed).")
+        add_score(score_data, rules, "spell_check_penalty", 0, issue_msg="Spell check skipped (pyspellchecker not installed).")
 
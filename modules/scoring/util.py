@@ -1,18 +1,123 @@
-def add_score(category_data, rule_map, check_name, earned, max_points_override=None, issue_msg=None, success_msg=None, is_penalty=False):
-    rule = rule_map.get(check_name, {"max_points": 0, "weight": 1})
-    max_p = max_points_override if max_points_override is not None else rule.get("max_points", 0)
-    actual_earned = (max_p - earned) if is_penalty else earned
-    category_data["earned_points"] += actual_earned * rule.get("weight", 1)
-    category_data["max_points"] += max_p * rule.get("weight", 1)
-    title_cased_check_name = check_name.replace('_score','').replace('_penalty','').replace('_',' ').title()
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+
+# Earning at least this share of a check's points counts as a success rather than an issue
+SUCCESS_SHARE = 0.8
+
+# Shared read-only default for missing sub-dicts, so lookups don't allocate a fresh {} per page
+EMPTY_DICT = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    max_points: float
+    weight: float
+    weighted_max: float      # max_points * weight, added to the category maximum
+    issue_threshold: float   # max_points * SUCCESS_SHARE
+    label: str               # display name used as the message prefix
+    is_penalty: bool         # earned points count against the check rather than towards it
+
+
+@dataclass(slots=True)
+class Scorecard:
+    """Running totals and messages for one scoring category of one page."""
+    earned_points: float = 0
+    max_points: float = 0
+    issues: list = field(default_factory=list)
+    successes: list = field(default_factory=list)
+
+
+def is_penalty_check(check_name: str) -> bool:
+    # Penalty checks are named "*_penalty" throughout DEFAULT_WEIGHTS
+    return check_name.endswith("_penalty")
+
+
+@lru_cache(maxsize=None)
+def check_label(check_name: str) -> str:
+    # "broken_links_penalty" -> "Broken Links"
+    return check_name.replace('_score','').replace('_penalty','').replace('_',' ').title()
+
+
+def compile_weights(weights: dict, required: frozenset = frozenset()) -> MappingProxyType:
+    """Resolve each scoring rule's points/weight once, so scorers avoid nested dict lookups per check.
+
+    Every name in `required` must resolve to a rule with non-negative points and weight; this is
+    checked here so the per-page scorers can index the result without fallbacks.
+    """
+    rules = {}
+    for name, cfg in weights.items():
+        if isinstance(cfg, dict) and "max_points" in cfg:
+            max_p = cfg["max_points"]
+            weight = cfg.get("weight", 1)
+            if not all(isinstance(v, (int, float)) and v >= 0 for v in (max_p, weight)):
+                raise ValueError(f"Invalid scoring weight for {name!r}: {cfg!r}")
+            rules[name] = Rule(max_p, weight, max_p * weight, max_p * SUCCESS_SHARE, check_label(name), is_penalty_check(name))
+    missing = required - rules.keys()
+    if missing:
+        raise ValueError(f"Scoring weights missing max_points for: {', '.join(sorted(missing))}")
+    # Read-only view: the rules are shared by every page scored with this module
+    return MappingProxyType(rules)
+
+
+def _message(msg):
+    # Messages may be deferred as (template, *args) or a zero-argument callable and are
+    # only formatted when they are actually recorded
+    if isinstance(msg, tuple):
+        return msg[0] % msg[1:]
+    if callable(msg):
+        return msg()
+    return msg
+
+
+def add_score(category_data, rules, check_name, earned, issue_msg=None, success_msg=None):
+    rule = rules[check_name]
+    max_p = rule.max_points
+    is_penalty = rule.is_penalty
+    category_data.earned_points += ((max_p - earned) if is_penalty else earned) * rule.weight
+    category_data.max_points += rule.weighted_max
+    if issue_msg is None and success_msg is None:
+        return
+    label = rule.label
     if is_penalty:
         if earned > 0 and issue_msg:
-            category_data["issues"].append(f"{title_cased_check_name}: {issue_msg} (Penalty: {earned:.1f}/{max_p:.1f})")
+            category_data.issues.append(f"{label}: {_message(issue_msg)} (Penalty: {earned:.1f}/{max_p:.1f})")
         elif success_msg:
-            category_data["successes"].append(f"{title_cased_check_name}: {success_msg} (Score: {max_p:.1f}/{max_p:.1f})")
-    else:
-        if earned < max_p * 0.8 and issue_msg:
-            category_data["issues"].append(f"{title_cased_check_name}: {issue_msg} (Score: {earned:.1f}/{max_p:.1f})")
-        elif earned >= max_p * 0.8 and success_msg:
-            category_data["successes"].append(f"{title_cased_check_name}: {success_msg} (Score: {earned:.1f}/{max_p:.1f})")
+            category_data.successes.append(f"{label}: {_message(success_msg)} (Score: {max_p:.1f}/{max_p:.1f})")
+    # Passing is the common case on healthy pages, so test it first
+    elif earned >= rule.issue_threshold:
+        if success_msg:
+            category_data.successes.append(f"{label}: {_message(success_msg)} (Score: {earned:.1f}/{max_p:.1f})")
+    elif issue_msg:
+        category_data.issues.append(f"{label}: {_message(issue_msg)} (Score: {earned:.1f}/{max_p:.1f})")
+
 
+# Modes for score_table rows; `arg` is the data key, or a tuple as noted
+#   flag:     full points when data[arg] is truthy
+#   any:      full points when any of the keys in arg is truthy
+#   not_none: full points when data[arg] is not None
+#   in:       full points when str(data[key]) is one of values; arg = (key, values)
+#   capped:   min(max_points, data[key] * factor); arg = (key, factor); a "%s" in the issue message is data[key]
+def score_table(table, data, score_data, rules, add_score):
+    get = data.get
+    for check_name, mode, arg, issue_msg, success_msg in table:
+        max_p = rules[check_name].max_points
+        # All-or-nothing modes scale by the condition as 0/1 instead of branching on it
+        if mode == "flag":
+            earned = max_p * bool(get(arg))
+        elif mode == "any":
+            earned = max_p * any(get(k) for k in arg)
+        elif mode == "not_none":
+            earned = max_p * (get(arg) is not None)
+        elif mode == "in":
+            key, values = arg
+            earned = max_p * (str(get(key, "")) in values)
+        elif mode == "capped":
+            key, factor = arg
+            value = get(key, 0)
+            earned = min(max_p, value * factor)
+            if issue_msg and "%" in issue_msg:
+                issue_msg = (issue_msg, value)
+        else:
+            raise ValueError(f"Unknown scoring mode: {mode}")
+        add_score(score_data, rules, check_name, earned, issue_msg=issue_msg, success_msg=success_msg)
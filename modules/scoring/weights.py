@@ -48,3 +48,6 @@ DEFAULT_WEIGHTS = {
     "category_weights": {"OnPage": 0.40, "Technical": 0.35, "Content": 0.25},
 }
 
+
+# Checks the scorers look up directly; user weight overrides must keep all of them scorable
+RULE_NAMES = frozenset(name for name, cfg in DEFAULT_WEIGHTS.items() if isinstance(cfg, dict) and "max_points" in cfg)
@@ -1,18 +1,88 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from statistics import mean
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import os
 import re
+import sys
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
 
 from .crawler import SiteCrawler
 from .. import on_page, technical, content, scoring
-from ..base_module import SEOModule
+from ..base_module import SEOModule, HTML_PARSER
 from .issues import derive_issues, Issue
 from .export import export_pages_csv, export_issues_csv, export_edges_csv
-from .duplication import group_duplicates_by_field, duplicate_text_by_hash
+from .duplication import (
+    group_duplicates_by_field, duplicate_text_by_hash, near_duplicate_text_groups, near_duplicate_field_groups,
+)
 from .sitemap import parse_sitemap, probe_url_statuses
+from .page_cache import body_hash, conditional_headers, config_fingerprint, load_page_cache, save_page_cache
+
+# Splits titles into word tokens for internal-link suggestions
+_WORD_SPLIT_RE = re.compile(r"\W+")
+
+
+def _analyze_page(url: str, on_page_analyzer, tech_analyzer, content_analyzer, scoring_module,
+                  prior: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    page_result: Dict[str, Any] = {'url': url, 'seo_attributes': {}}
+    # Fetch and parse the page once for all analyzers (each falls back to its own fetch if this fails).
+    # `prior` is this URL's incremental-cache record ({} if none); None means the cache is off.
+    headers = conditional_headers(prior) if prior else None
+    resp, body = on_page_analyzer.fetch_body(url, headers=headers)
+    hit = False
+    if prior is not None and resp is not None:
+        entry = {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'body_hash': body_hash(body),
+        }
+        if prior.get('seo_attributes'):
+            if resp.status_code == 304:
+                # Not modified: the server kept the validators we sent
+                entry = {k: prior.get(k) for k in entry}
+                hit = True
+            else:
+                hit = entry['body_hash'] == prior.get('body_hash')
+        page_result['_cache'] = {**entry, 'hit': hit}
+    soup = None
+    if body is not None and resp is not None and resp.status_code != 304:
+        try:
+            soup = BeautifulSoup(body, HTML_PARSER)
+        except Exception:
+            soup = None
+    if hit:
+        # Unchanged body: reuse the on-page and content results, but re-run the technical checks
+        # (headers, robots, SSL, timings can change without the HTML changing) and rescore
+        page_result['seo_attributes'] = dict(prior['seo_attributes'])
+        page_result['seo_attributes'].update(tech_analyzer.analyze(url, soup=soup))
+        scoring_data = scoring_module.analyze(url=url, full_report_data=page_result['seo_attributes'])
+        page_result['seo_attributes'].update(scoring_data)
+        return page_result
+    # Run per-page analyzers
+    page_result['seo_attributes'].update(on_page_analyzer.analyze(url, soup=soup))
+    page_result['seo_attributes'].update(tech_analyzer.analyze(url, soup=soup))
+    page_result['seo_attributes'].update(content_analyzer.analyze(url, soup=soup))
+    # Score aggregation
+    scoring_data = scoring_module.analyze(url=url, full_report_data=page_result['seo_attributes'])
+    page_result['seo_attributes'].update(scoring_data)
+    return page_result
+
+
+# Analyzer modules of a worker process, built once by _init_process_worker
+_process_modules = None
+
+
+def _init_process_worker(root_url: str, app_config: Dict[str, Any], target_keywords: Optional[List[str]]) -> None:
+    global _process_modules
+    _process_modules = FullSiteAudit(root_url, app_config)._build_modules(target_keywords)
+
+
+def _analyze_page_in_process(url: str, prior: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return _analyze_page(url, *_process_modules, prior=prior)
 
 
 @dataclass
@@ -42,21 +112,33 @@ class FullSiteAudit:
             'respect_robots': full_cfg.get('respect_robots', True),
             'same_domain_only': full_cfg.get('same_domain_only', True),
             'include_subdomains': full_cfg.get('include_subdomains', False),
+            'crawl_workers': full_cfg.get('crawl_workers', 4),
             'user_agent': self.app_config.get('Global', {}).get('user_agent', 'Mozilla/5.0 (compatible; SEOAnalyzer/1.0)')
         }
         self.workers = int(full_cfg.get('workers', 4))
+        # Run page analysis in worker processes so parsing isn't serialized by the GIL
+        self.use_processes = bool(full_cfg.get('use_processes', False))
+        # Jaccard similarity of visible text at which pages count as near-duplicates
+        self.near_duplicate_threshold = float(full_cfg.get('near_duplicate_threshold', 0.9))
+        # Reuse the previous run's results for pages whose body is unchanged (needs an export_dir for the cache)
+        self.incremental = bool(full_cfg.get('incremental', False))
+        self.sitemap_probe_workers = int(full_cfg.get('sitemap_probe_workers', 16))
 
-    def _build_modules(self):
+    def _build_modules(self, target_keywords: Optional[List[str]] = None):
         on_page_cfg = self.app_config.get('OnPageAnalyzer', {})
         tech_cfg = self.app_config.get('TechnicalSEOAnalyzer', {})
         content_cfg = self.app_config.get('ContentAnalyzer', {})
         score_cfg = self.app_config.get('ScoringModule', {})
-        return (
+        modules = (
             on_page.OnPageAnalyzer(config={'Global': self.app_config.get('Global', {}), **on_page_cfg}),
             technical.TechnicalSEOAnalyzer(config={'Global': self.app_config.get('Global', {}), **tech_cfg}),
             content.ContentAnalyzer(config={'Global': self.app_config.get('Global', {}), **content_cfg}),
             scoring.ScoringModule(config={'Global': self.app_config.get('Global', {}), **score_cfg}),
         )
+        # Inject keywords if provided
+        if target_keywords:
+            modules[2].config['target_keywords'] = target_keywords
+        return modules
 
     def run(self, target_keywords: Optional[List[str]] = None, export_dir: Optional[str] = None) -> Dict[str, Any]:
         crawler = SiteCrawler(self.root_url, session=None, config=self.crawl_config)
@@ -66,30 +148,44 @@ class FullSiteAudit:
         errors: List[Dict[str, Any]] = []
         all_issues: List[Issue] = []
 
-        on_page_analyzer, tech_analyzer, content_analyzer, scoring_module = self._build_modules()
+        # Processes only pay off while the GIL serializes the CPU-bound parsing; free-threaded builds stay on threads
+        if self.use_processes and getattr(sys, '_is_gil_enabled', lambda: True)():
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_process_worker,
+                                           initargs=(self.root_url, self.app_config, target_keywords))
+            analyze, module_args = _analyze_page_in_process, ()
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+            analyze, module_args = _analyze_page, self._build_modules(target_keywords)
 
-        # Inject keywords if provided
-        if target_keywords:
-            c_cfg = content_analyzer.config
-            c_cfg['target_keywords'] = target_keywords
-
-        def analyze_one(url: str) -> Dict[str, Any]:
-            page_result: Dict[str, Any] = {'url': url, 'seo_attributes': {}}
-            # Run per-page analyzers
-            page_result['seo_attributes'].update(on_page_analyzer.analyze(url))
-            page_result['seo_attributes'].update(tech_analyzer.analyze(url))
-            page_result['seo_attributes'].update(content_analyzer.analyze(url))
-            # Score aggregation
-            scoring_data = scoring_module.analyze(url=url, full_report_data=page_result['seo_attributes'])
-            page_result['seo_attributes'].update(scoring_data)
-            return page_result
-
-        with ThreadPoolExecutor(max_workers=self.workers) as ex:
-            future_map = {ex.submit(analyze_one, u): u for u in discovered_urls}
+        cache_path = None
+        prior_cache: Dict[str, Dict[str, Any]] = {}
+        new_cache: Dict[str, Dict[str, Any]] = {}
+        cache_stats = {'cache_hits': 0, 'cache_misses': 0}
+        if self.incremental and export_dir:
+            site = urlparse(self.root_url).netloc.replace(':', '_') or 'site'
+            cache_path = os.path.join(export_dir, '.cache', f'{site}.json')
+            # Results depend on the analyzer config, keywords and scoring weights; a cache written
+            # under different settings is discarded rather than reused
+            score_cfg = self.app_config.get('ScoringModule', {})
+            weights = scoring.ScoringModule(config={'Global': self.app_config.get('Global', {}), **score_cfg}).default_weights
+            # Crawl/audit settings (FullSiteAudit) don't change per-page results, so they're left out
+            analyzer_config = {k: v for k, v in self.app_config.items() if k != 'FullSiteAudit'}
+            fingerprint = config_fingerprint(analyzer_config, target_keywords, weights)
+            prior_cache = load_page_cache(cache_path, fingerprint)
+
+        with executor as ex:
+            if cache_path:
+                future_map = {ex.submit(analyze, u, *module_args, prior=prior_cache.get(u, {})): u for u in discovered_urls}
+            else:
+                future_map = {ex.submit(analyze, u, *module_args): u for u in discovered_urls}
             for fut in as_completed(future_map):
                 u = future_map[fut]
                 try:
                     result = fut.result()
+                    cache_entry = result.pop('_cache', None)
+                    if cache_entry is not None:
+                        cache_stats['cache_hits' if cache_entry.pop('hit') else 'cache_misses'] += 1
+                        new_cache[u] = {**cache_entry, 'seo_attributes': result['seo_attributes']}
                     pages.append(result)
                     # Derive issues per page
                     pg_issues = derive_issues(u, result.get('seo_attributes', {}))
@@ -97,43 +193,59 @@ class FullSiteAudit:
                 except Exception as e:
                     errors.append({'url': u, 'error': str(e)})
 
-        # Aggregate domain-level summary
+        # Aggregate score averages, status/redirect indicators, the internal link graph and the
+        # per-page maps used for link suggestions in one pass over pages
         overall_scores = []
         tech_scores = []
         onpage_scores = []
         content_scores = []
-        for p in pages:
-            sdata = p['seo_attributes'].get('ScoringModule', {})
-            if not sdata:
-                continue
-            if 'overall_seo_score_percent' in sdata:
-                overall_scores.append(sdata['overall_seo_score_percent'])
-            if 'technical_score_percent' in sdata:
-                tech_scores.append(sdata['technical_score_percent'])
-            if 'on_page_score_percent' in sdata:
-                onpage_scores.append(sdata['on_page_score_percent'])
-            if 'content_score_percent' in sdata:
-                content_scores.append(sdata['content_score_percent'])
-
-        # Status code distribution and redirects/loop indicators from page data
         status_distribution: Dict[str, int] = {}
         redirect_loops: List[str] = []
+        nodes = {}
+        edges = []
+        # page -> lowercased text sample (lowercased once, not per suggestion pair), title, outbound link set
+        text_samples: Dict[str, str] = {}
+        titles: Dict[str, str] = {}
+        link_out: Dict[str, Set[str]] = {}
+        url_set = {p.get('url') for p in pages}
         for p in pages:
-            tech = p['seo_attributes'].get('TechnicalSEOAnalyzer', {})
+            page_url = p.get('url')
+            attrs = p['seo_attributes']
+            sdata = attrs.get('ScoringModule', {})
+            if sdata:
+                if 'overall_seo_score_percent' in sdata:
+                    overall_scores.append(sdata['overall_seo_score_percent'])
+                if 'technical_score_percent' in sdata:
+                    tech_scores.append(sdata['technical_score_percent'])
+                if 'on_page_score_percent' in sdata:
+                    onpage_scores.append(sdata['on_page_score_percent'])
+                if 'content_score_percent' in sdata:
+                    content_scores.append(sdata['content_score_percent'])
+
+            tech = attrs.get('TechnicalSEOAnalyzer', {})
             sc = tech.get('httpStatusCode')
             if sc is not None:
                 status_distribution[str(sc)] = status_distribution.get(str(sc), 0) + 1
             # Detect loop if redirectHistory repeats a URL
-            rh = tech.get('redirectHistory') or []
-            seen_urls = set()
-            for hop in rh:
-                u = hop.get('url')
-                if not u:
-                    continue
-                if u in seen_urls:
-                    redirect_loops.append(p.get('url'))
-                    break
-                seen_urls.add(u)
+            rh = tech.get('redirectHistory')
+            if rh:
+                hop_urls = [u for u in (hop.get('url') for hop in rh) if u]
+                if len(set(hop_urls)) != len(hop_urls):
+                    redirect_loops.append(page_url)
+
+            # Build internal link graph from on-page data
+            ona = attrs.get('OnPageAnalyzer', {})
+            outlinks = ona.get('internalLinks') or []
+            nodes.setdefault(page_url, {'in': 0, 'out': 0})
+            nodes[page_url]['out'] += len(outlinks)
+            for v in outlinks:
+                edges.append({'source': page_url, 'target': v})
+                if v in url_set:
+                    nodes.setdefault(v, {'in': 0, 'out': 0})
+                    nodes[v]['in'] += 1
+            text_samples[page_url] = (ona.get('visibleTextSample') or '').lower()
+            titles[page_url] = ona.get('title') or ''
+            link_out[page_url] = set(outlinks)
 
         # Aggregate issues by severity
         sev_counts = {'error': 0, 'warning': 0, 'notice': 0}
@@ -149,51 +261,36 @@ class FullSiteAudit:
         except Exception:
             pass
 
-        # Build internal link graph from on-page data
-        nodes = {}
-        edges = []
-        url_set = {p.get('url') for p in pages}
-        for p in pages:
-            u = p.get('url')
-            ona = p['seo_attributes'].get('OnPageAnalyzer', {})
-            outlinks = ona.get('internalLinks') or []
-            nodes.setdefault(u, {'in': 0, 'out': 0})
-            nodes[u]['out'] += len(outlinks)
-            for v in outlinks:
-                edges.append({'source': u, 'target': v})
-                if v in url_set:
-                    nodes.setdefault(v, {'in': 0, 'out': 0})
-                    nodes[v]['in'] += 1
-
         # Duplicate detection across site
         dup_titles = group_duplicates_by_field(pages, ["OnPageAnalyzer", "title"])
         dup_meta = group_duplicates_by_field(pages, ["OnPageAnalyzer", "metaDescription"])
         dup_h1 = group_duplicates_by_field(pages, ["OnPageAnalyzer", "h1"])  # if string; h1 is list; skip
         dup_text_hash = duplicate_text_by_hash(pages)
+        near_dup_text = near_duplicate_text_groups(pages, self.near_duplicate_threshold)
+        near_dup_titles = near_duplicate_field_groups(pages, ["OnPageAnalyzer", "title"])
+        near_dup_meta = near_duplicate_field_groups(pages, ["OnPageAnalyzer", "metaDescription"])
 
         # Simple internal linking suggestions
         suggestions = []
-        # Build a quick map of page -> text sample
-        text_samples = {p.get('url'): (p['seo_attributes'].get('OnPageAnalyzer', {}).get('visibleTextSample') or '') for p in pages}
-        titles = {p.get('url'): (p['seo_attributes'].get('OnPageAnalyzer', {}).get('title') or '') for p in pages}
-        link_out = {p.get('url'): set(p['seo_attributes'].get('OnPageAnalyzer', {}).get('internalLinks') or []) for p in pages}
+        no_links: Set[str] = set()
+        # Pages with no inbound links (link-graph sinks) and their 4+ char title tokens, resolved once
+        sinks = []
         for target, deg in nodes.items():
-            if deg.get('in', 0) == 0:  # low inbound
-                target_title = titles.get(target, '')
-                if not target_title:
+            if deg['in'] == 0:  # low inbound
+                tokens = [t for t in _WORD_SPLIT_RE.split(titles.get(target, '').lower()) if len(t) > 3]
+                if tokens:
+                    sinks.append((target, tokens))
+        sample_items = list(text_samples.items())
+        for target, tokens in sinks:
+            probe = tokens[:3]
+            for source, sample in sample_items:
+                if source == target:
                     continue
-                tokens = [t for t in re.split(r"\W+", target_title.lower()) if len(t) > 3]
-                if not tokens:
+                if target in link_out.get(source, no_links):
                     continue
-                for source in titles.keys():
-                    if source == target:
-                        continue
-                    if target in link_out.get(source, set()):
-                        continue
-                    sample = text_samples.get(source, '').lower()
-                    if any(tok in sample for tok in tokens[:3]):
-                        suggestions.append({'from': source, 'to': target, 'anchor_hint': tokens[0]})
-                        break
+                if any(tok in sample for tok in probe):
+                    suggestions.append({'from': source, 'to': target, 'anchor_hint': tokens[0]})
+                    break
 
         # Parse sitemaps and bucket statuses (site-level)
         try:
@@ -201,7 +298,8 @@ class FullSiteAudit:
             base_url = self.root_url
             robots_txt_content = tech_any.get('robots_txt_content_full')
             sm = parse_sitemap(base_url, robots_txt_content=robots_txt_content, timeout=self.app_config.get('Global', {}).get('request_timeout', 10))
-            status_buckets = probe_url_statuses(sm.get('sitemapUrls', [])[:500], timeout=self.app_config.get('Global', {}).get('request_timeout', 10))
+            status_buckets = probe_url_statuses(sm.get('sitemapUrls', [])[:500], timeout=self.app_config.get('Global', {}).get('request_timeout', 10),
+                                               workers=self.sitemap_probe_workers)
         except Exception:
             sm = {'parsedAnySitemap': False, 'sitemapUrls': [], 'sitemapErrors': []}
             status_buckets = {}
@@ -223,6 +321,9 @@ class FullSiteAudit:
             'duplicate_titles': dup_titles,
             'duplicate_meta_descriptions': dup_meta,
             'duplicate_text_groups': dup_text_hash,
+            'near_duplicate_text_groups': near_dup_text,
+            'near_duplicate_titles': near_dup_titles,
+            'near_duplicate_meta_descriptions': near_dup_meta,
             'link_suggestions': suggestions,
             'sitemap_summary': {
                 'parsed_any': sm.get('parsedAnySitemap'),
@@ -232,16 +333,26 @@ class FullSiteAudit:
                 'status_buckets': status_buckets,
             },
         }
+        if cache_path:
+            summary['incremental_cache'] = cache_stats
+            try:
+                save_page_cache(cache_path, new_cache, fingerprint)
+            except (OSError, TypeError, ValueError):
+                pass
 
+        # Converted once; the report's list is a copy because site-level issues are appended to it below
+        page_issue_dicts = [i.to_dict() for i in all_issues]
         report = {
             'site_audit': {
                 'summary': summary,
                 'pages': pages,
                 'errors': errors,
-                'issues': [i.to_dict() for i in all_issues],
+                'issues': list(page_issue_dicts),
                 'config_used': {
                     'crawl': self.crawl_config,
                     'workers': self.workers,
+                    'use_processes': self.use_processes,
+                    'incremental': self.incremental,
                 }
             }
         }
@@ -261,10 +372,9 @@ class FullSiteAudit:
         # Optional CSV export
         if export_dir:
             try:
-                import os
                 os.makedirs(export_dir, exist_ok=True)
                 export_pages_csv(os.path.join(export_dir, 'pages.csv'), pages)
-                export_issues_csv(os.path.join(export_dir, 'issues.csv'), [i.to_dict() for i in all_issues])
+                export_issues_csv(os.path.join(export_dir, 'issues.csv'), page_issue_dicts)
                 export_edges_csv(os.path.join(export_dir, 'edges.csv'), edges)
                 report['site_audit']['exports'] = {
                     'pages_csv': os.path.join(export_dir, 'pages.csv'),
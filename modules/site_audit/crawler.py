@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable, Set, List, Tuple, Optional
 from urllib.parse import urlparse, urljoin, urldefrag
+import threading
 import time
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import urllib.robotparser as robotparser
 import requests
 
+from ..base_module import HTML_PARSER
+
+# Discovery only needs links, so the parser skips building the rest of the tree
+_LINKS_ONLY = SoupStrainer('a', href=True)
+
 
 def _normalize_url(base: str, href: str) -> Optional[str]:
     if not href:
@@ -22,6 +30,17 @@ def _normalize_url(base: str, href: str) -> Optional[str]:
     return abs_url
 
 
+def _compile_path_filters(patterns: Optional[List[str]]) -> Tuple[Tuple[str, ...], List[re.Pattern]]:
+    """Split include/exclude entries into plain path prefixes and compiled `re:` patterns."""
+    prefixes = tuple(p for p in patterns or () if not p.startswith('re:'))
+    regexes = [re.compile(p[3:]) for p in patterns or () if p.startswith('re:')]
+    return prefixes, regexes
+
+
+def _path_matches(path: str, prefixes: Tuple[str, ...], regexes: List[re.Pattern]) -> bool:
+    return path.startswith(prefixes) or any(r.search(path) for r in regexes)
+
+
 def _is_html_response(resp: requests.Response) -> bool:
     ctype = resp.headers.get('Content-Type', '')
     return 'text/html' in ctype or 'application/xhtml+xml' in ctype
@@ -42,6 +61,7 @@ class CrawlConfig:
     auth_password: Optional[str] = None
     extra_headers: Optional[dict] = None
     render_js: bool = False
+    crawl_workers: int = 4   # pages fetched concurrently; rendering with Playwright always runs one at a time
 
 
 class SiteCrawler:
@@ -69,6 +89,7 @@ class SiteCrawler:
             auth_password=cfg.get('auth_password'),
             extra_headers=cfg.get('extra_headers'),
             render_js=bool(cfg.get('render_js', False)),
+            crawl_workers=max(1, int(cfg.get('crawl_workers', 4))),
         )
 
         self.session = session or requests.Session()
@@ -87,7 +108,11 @@ class SiteCrawler:
             except Exception:
                 self.rp = None
 
+        self._include_filters = _compile_path_filters(self.cfg.include_paths)
+        self._exclude_filters = _compile_path_filters(self.cfg.exclude_paths)
+
         self._last_request_ts = 0.0
+        self._rate_lock = threading.Lock()
 
     def _allowed_by_robots(self, url: str) -> bool:
         if not self.rp:
@@ -108,90 +133,103 @@ class SiteCrawler:
     def _path_allowed(self, url: str) -> bool:
         parsed = urlparse(url)
         path = parsed.path or '/'
-        inc = self.cfg.include_paths
-        exc = self.cfg.exclude_paths
         allowed = True
-        if inc:
-            allowed = any((path.startswith(p) if not p.startswith('re:') else re.search(p[3:], path)) for p in inc)
-        if exc and allowed:
-            if any((path.startswith(p) if not p.startswith('re:') else re.search(p[3:], path)) for p in exc):
+        if self.cfg.include_paths:
+            allowed = _path_matches(path, *self._include_filters)
+        if self.cfg.exclude_paths and allowed:
+            if _path_matches(path, *self._exclude_filters):
                 allowed = False
         return allowed
 
     def _rate_limit(self):
         if self.cfg.rate_limit_rps and self.cfg.rate_limit_rps > 0:
             gap = 1.0 / self.cfg.rate_limit_rps
-            now = time.time()
-            sleep_for = self._last_request_ts + gap - now
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-            self._last_request_ts = time.time()
-
-    def crawl(self) -> List[str]:
-        queue: List[Tuple[str, int]] = [(self.start_url, 0)]
-        visited: Set[str] = set()
-        results: List[str] = []
-
-        while queue and len(results) < self.cfg.max_pages:
-            url, depth = queue.pop(0)
-            if url in visited:
-                continue
-            visited.add(url)
-
-            if depth > self.cfg.max_depth:
-                continue
-            if not self._domain_allowed(url):
-                continue
-            if not self._allowed_by_robots(url):
-                continue
-
-            try:
-                self._rate_limit()
-                if self.cfg.render_js:
-                    try:
-                        from .render import render_html
-                        html = render_html(url, user_agent=self.cfg.user_agent)
-                        if not html:
-                            resp = self.session.get(url, timeout=10, allow_redirects=True)
-                            content = resp.content if resp and resp.status_code < 400 else None
-                        else:
-                            content = html.encode('utf-8')
-                            resp = None
-                    except Exception:
+            # Held while sleeping so concurrent fetches still go out one gap apart
+            with self._rate_lock:
+                now = time.time()
+                sleep_for = self._last_request_ts + gap - now
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                self._last_request_ts = time.time()
+
+    def _fetch(self, url: str):
+        """Return (response or None, content) for url, or None if the request failed."""
+        try:
+            self._rate_limit()
+            if self.cfg.render_js:
+                try:
+                    from .render import render_html
+                    html = render_html(url, user_agent=self.cfg.user_agent)
+                    if not html:
                         resp = self.session.get(url, timeout=10, allow_redirects=True)
                         content = resp.content if resp and resp.status_code < 400 else None
-                else:
+                    else:
+                        content = html.encode('utf-8')
+                        resp = None
+                except Exception:
                     resp = self.session.get(url, timeout=10, allow_redirects=True)
                     content = resp.content if resp and resp.status_code < 400 else None
-            except requests.RequestException:
-                continue
-
-            if resp is not None:
-                if not _is_html_response(resp) or resp.status_code >= 400:
-                    continue
-                content = resp.content
+            else:
+                resp = self.session.get(url, timeout=10, allow_redirects=True)
+                content = resp.content if resp and resp.status_code < 400 else None
+        except requests.RequestException:
+            return None
+        return resp, content
 
-            # Path filters
-            if not self._path_allowed(url):
-                continue
-            results.append(url)
+    def crawl(self) -> List[str]:
+        queue: deque[Tuple[str, int]] = deque([(self.start_url, 0)])
+        # Every URL ever queued; BFS queues each URL first at its shallowest depth, so later sightings are dropped
+        enqueued: Set[str] = {self.start_url}
+        results: List[str] = []
+        workers = 1 if self.cfg.render_js else self.cfg.crawl_workers
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while queue and len(results) < self.cfg.max_pages:
+                # Take the next few fetchable URLs off the front of the queue and fetch them together.
+                # Links they yield are only queued behind them, so the visit order matches a serial crawl.
+                batch: List[Tuple[str, int]] = []
+                batch_size = min(workers, self.cfg.max_pages - len(results))
+                while queue and len(batch) < batch_size:
+                    url, depth = queue.popleft()
+                    if depth > self.cfg.max_depth:
+                        continue
+                    if not self._domain_allowed(url):
+                        continue
+                    if not self._allowed_by_robots(url):
+                        continue
+                    batch.append((url, depth))
+
+                for (url, depth), fetched in zip(batch, pool.map(self._fetch, [u for u, _ in batch])):
+                    if fetched is None:
+                        continue
+                    resp, content = fetched
+                    if resp is not None:
+                        if not _is_html_response(resp) or resp.status_code >= 400:
+                            continue
+                        content = resp.content
+
+                    # Path filters
+                    if not self._path_allowed(url):
+                        continue
+                    results.append(url)
 
-            try:
-                soup = BeautifulSoup(content, 'html.parser')
-            except Exception:
-                continue
-
-            for a in soup.find_all('a', href=True):
-                norm = _normalize_url(url, a['href'])
-                if not norm:
-                    continue
-                if norm in visited:
-                    continue
-                if not self._domain_allowed(norm):
-                    continue
-                queue.append((norm, depth + 1))
-
-            if len(results) >= self.cfg.max_pages:
-                break
+                    try:
+                        soup = BeautifulSoup(content, HTML_PARSER, parse_only=_LINKS_ONLY)
+                    except Exception:
+                        continue
+
+                    for a in soup.find_all('a', href=True):
+                        norm = _normalize_url(url, a['href'])
+                        if not norm:
+                            continue
+                        if norm in enqueued:
+                            continue
+                        if not self._domain_allowed(norm):
+                            continue
+                        enqueued.add(norm)
+                        queue.append((norm, depth + 1))
+
+                    if len(results) >= self.cfg.max_pages:
+                        break
 
         return results
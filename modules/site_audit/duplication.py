@@ -2,11 +2,26 @@ from __future__ import annotations
 
 from typing import Dict, List, Any, Tuple
 from collections import defaultdict
+import hashlib
 import re
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
 def _norm_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip().lower()) if s else ""
+    # Lowercase and collapse whitespace runs to single spaces; str.split() splits on the same
+    # characters as the regex \s+ and strips the ends, without going through the regex engine
+    return " ".join(s.lower().split()) if s else ""
+
+
+def _field_value(page: Dict[str, Any], field_path: List[str]) -> Any:
+    f = page.get('seo_attributes', {})
+    for key in field_path:
+        f = f.get(key, {}) if isinstance(f, dict) else None
+        if f is None:
+            break
+    return f
 
 
 def group_duplicates_by_field(pages: List[Dict[str, Any]], field_path: List[str]) -> Dict[str, List[str]]:
@@ -14,19 +29,25 @@ def group_duplicates_by_field(pages: List[Dict[str, Any]], field_path: List[str]
     Groups pages by a normalized string field and returns mapping: normalized_value -> [urls]
     field_path: e.g., ["OnPageAnalyzer", "title"]
     """
-    groups: Dict[str, List[str]] = defaultdict(list)
+    # Values seen once are parked in first_seen; a group is only created on the second occurrence,
+    # so the (usually mostly unique) values never need filtering out afterwards
+    first_seen: Dict[str, str] = {}
+    groups: Dict[str, List[str]] = {}
     for p in pages:
-        attrs = p.get('seo_attributes', {})
-        f = attrs
-        for key in field_path:
-            f = f.get(key, {}) if isinstance(f, dict) else None
-            if f is None:
-                break
+        f = _field_value(p, field_path)
         if isinstance(f, str) and f:
             val = _norm_text(f)
-            if val:
-                groups[val].append(p.get('url'))
-    return {k: v for k, v in groups.items() if len(v) > 1}
+            if not val:
+                continue
+            url = p.get('url')
+            group = groups.get(val)
+            if group is not None:
+                group.append(url)
+            elif val in first_seen:
+                groups[val] = [first_seen.pop(val), url]
+            else:
+                first_seen[val] = url
+    return groups
 
 
 def duplicate_text_by_hash(pages: List[Dict[str, Any]]) -> Dict[str, List[str]]:
@@ -42,3 +63,167 @@ def duplicate_text_by_hash(pages: List[Dict[str, Any]]) -> Dict[str, List[str]]:
             groups[h].append(p.get('url'))
     return {k: v for k, v in groups.items() if len(v) > 1}
 
+
+# MinHash parameters for near-duplicate text detection. Signatures are split into bands of
+# rows; pages sharing any whole band become candidates (about 77% similarity or more is likely
+# to collide), and candidates are then confirmed with their exact shingle Jaccard similarity.
+_SHINGLE_WORDS = 5
+_MINHASH_BANDS = 8
+_MINHASH_ROWS = 8
+_MINHASH_BINS = _MINHASH_BANDS * _MINHASH_ROWS  # power of two; low hash bits pick the bin
+
+
+def _shingles(text: str) -> frozenset:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= _SHINGLE_WORDS:
+        return frozenset([" ".join(words)]) if words else frozenset()
+    return frozenset(" ".join(words[i:i + _SHINGLE_WORDS]) for i in range(len(words) - _SHINGLE_WORDS + 1))
+
+
+def _minhash(shingles: frozenset) -> List[int]:
+    # One-permutation MinHash: each shingle is hashed once and only competes for the minimum of
+    # its own bin, instead of being rehashed for every permutation. blake2b keeps signatures
+    # stable across runs (str hash() is salted per process).
+    sig: List[Any] = [None] * _MINHASH_BINS
+    mask = _MINHASH_BINS - 1
+    shift = mask.bit_length()
+    for s in shingles:
+        h = int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+        b, v = h & mask, h >> shift
+        cur = sig[b]
+        if cur is None or v < cur:
+            sig[b] = v
+    # Densify: short texts leave most bins empty, and all-empty bands would collide for every
+    # short page. Each empty bin borrows the next non-empty bin's value (wrapping around), offset
+    # by the distance so borrowed values can't be confused with real ones.
+    if None in sig:
+        offset = 1 << (64 - shift)  # above any v
+        filled = sig[:]
+        for b in range(_MINHASH_BINS):
+            if filled[b] is None:
+                d = 1
+                while filled[(b + d) & mask] is None:
+                    d += 1
+                sig[b] = filled[(b + d) & mask] + d * offset
+    return sig
+
+
+def near_duplicate_text_groups(pages: List[Dict[str, Any]], threshold: float = 0.9) -> Dict[str, List[str]]:
+    """
+    Clusters pages whose OnPageAnalyzer.visibleTextSample word 5-gram sets have Jaccard similarity
+    >= threshold, using MinHash-LSH banding to avoid comparing every pair. Exact duplicates
+    (same visibleTextHash) are represented by their first page only.
+    Returns mapping: first url of the cluster -> [urls]
+    """
+    urls: List[str] = []
+    shingle_sets: List[frozenset] = []
+    buckets: Dict[Tuple[int, Tuple[Any, ...]], List[int]] = defaultdict(list)
+    exact_seen = set()
+    for p in pages:
+        ona = p.get('seo_attributes', {}).get('OnPageAnalyzer', {})
+        sample = ona.get('visibleTextSample') or ''
+        # Exact copies are already reported by duplicate_text_by_hash; only the first takes part here
+        exact_key = ona.get('visibleTextHash') or sample
+        if exact_key in exact_seen:
+            continue
+        exact_seen.add(exact_key)
+        sh = _shingles(sample)
+        if not sh:
+            continue
+        idx = len(urls)
+        urls.append(p.get('url'))
+        shingle_sets.append(sh)
+        sig = _minhash(sh)
+        for band in range(_MINHASH_BANDS):
+            buckets[(band, tuple(sig[band * _MINHASH_ROWS:(band + 1) * _MINHASH_ROWS]))].append(idx)
+
+    def similar(i: int, j: int) -> bool:
+        a, b = shingle_sets[i], shingle_sets[j]
+        return len(a & b) >= threshold * len(a | b)
+
+    return _cluster_candidates(urls, buckets.values(), similar)
+
+
+def _cluster_candidates(urls: List[str], buckets, similar) -> Dict[str, List[str]]:
+    # Union-find over candidate pairs (indices sharing a bucket) that `similar` confirms
+    parent = list(range(len(urls)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in buckets:
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if similar(i, j):
+                    ri, rj = find(i), find(j)
+                    if ri != rj:
+                        parent[max(ri, rj)] = min(ri, rj)
+
+    clusters: Dict[int, List[str]] = defaultdict(list)
+    for i, u in enumerate(urls):
+        clusters[find(i)].append(u)
+    return {urls[root]: members for root, members in clusters.items() if len(members) > 1}
+
+
+# SimHash signatures are split into this many 16-bit chunks. Two signatures within Hamming
+# distance 3 differ in at most 3 chunks, so they always share at least one chunk exactly.
+_SIMHASH_CHUNKS = 4
+
+
+def simhash64(text: str) -> int:
+    """64-bit SimHash over character 3-grams of the text's words (punctuation and case ignored)."""
+    s = " ".join(_WORD_RE.findall(text.lower()))
+    if not s:
+        return 0
+    grams = {s[i:i + 3] for i in range(max(1, len(s) - 2))}
+    # A bit is set when more than half the grams' hashes set it; counting down the columns of the
+    # hashes' binary strings keeps the per-bit tally out of a Python-level 64-step loop per gram
+    rows = [format(int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'little'), '064b')
+            for g in grams]
+    half = len(rows) / 2
+    sig = 0
+    for col in zip(*rows):
+        sig = (sig << 1) | (col.count('1') > half)
+    return sig
+
+
+def near_duplicate_field_groups(pages: List[Dict[str, Any]], field_path: List[str], max_distance: int = 3) -> Dict[str, List[str]]:
+    """
+    Clusters pages whose short string field (e.g. title) has SimHash signatures within
+    max_distance bits, catching variants like "My Page | Site" vs "My Page - Site".
+    max_distance above 3 may miss pairs, since candidates must share a whole 16-bit chunk.
+    Exact duplicates of a normalized value are represented by their first page only.
+    Returns mapping: first url of the cluster -> [urls]
+    """
+    urls: List[str] = []
+    sigs: List[int] = []
+    buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    exact_seen = set()
+    for p in pages:
+        val = _field_value(p, field_path)
+        if not isinstance(val, str) or not val.strip():
+            continue
+        # Exact copies (after normalization) are already reported by group_duplicates_by_field;
+        # only the first takes part here
+        norm = _norm_text(val)
+        if norm in exact_seen:
+            continue
+        exact_seen.add(norm)
+        sig = simhash64(val)
+        idx = len(urls)
+        urls.append(p.get('url'))
+        sigs.append(sig)
+        for chunk in range(_SIMHASH_CHUNKS):
+            buckets[(chunk, (sig >> (16 * chunk)) & 0xFFFF)].append(idx)
+
+    def similar(i: int, j: int) -> bool:
+        return (sigs[i] ^ sigs[j]).bit_count() <= max_distance
+
+    return _cluster_candidates(urls, buckets.values(), similar)
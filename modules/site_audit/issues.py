@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     url: str
     code: str
@@ -14,7 +16,15 @@ class Issue:
     details: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Fields are all strings, so a flat dict matches asdict() without its recursive copying
+        return {
+            'url': self.url,
+            'code': self.code,
+            'title': self.title,
+            'severity': self.severity,
+            'category': self.category,
+            'details': self.details,
+        }
 
 
 def _sev(cond: bool, when_true: str, when_false: str = "") -> str:
@@ -43,6 +53,11 @@ def derive_issues(url: str, page_attrs: Dict[str, Any]) -> List[Issue]:
     onpage = page_attrs.get('OnPageAnalyzer', {})
     tech = page_attrs.get('TechnicalSEOAnalyzer', {})
     content = page_attrs.get('ContentAnalyzer', {})
+    # Parsed once for the scheme and path checks below; None if the URL can't be parsed
+    try:
+        pu = urlparse(url)
+    except ValueError:
+        pu = None
 
     # HTTP status buckets
     sc = tech.get('httpStatusCode')
@@ -103,11 +118,9 @@ def derive_issues(url: str, page_attrs: Dict[str, Any]) -> List[Issue]:
         issues.append(Issue(url, 'NO_CANONICAL', 'Missing canonical tag', 'warning', 'technical', 'Add a rel=canonical to prevent duplicate content issues'))
     # Cross-scheme canonicals
     can_url = tech.get('canonicalUrl')
-    if can_url and isinstance(can_url, str):
+    if pu is not None and can_url and isinstance(can_url, str):
         try:
-            from urllib.parse import urlparse
             cu = urlparse(can_url)
-            pu = urlparse(url)
             if pu.scheme == 'http' and cu.scheme == 'https':
                 issues.append(Issue(url, 'CANONICAL_HTTP_TO_HTTPS', 'Canonical from HTTP to HTTPS', 'notice', 'technical', 'Prefer canonical on final protocol'))
             if pu.scheme == 'https' and cu.scheme == 'http':
@@ -120,9 +133,10 @@ def derive_issues(url: str, page_attrs: Dict[str, Any]) -> List[Issue]:
         issues.append(Issue(url, 'NOINDEX', 'Page set to noindex', 'warning', 'technical', 'Remove noindex to allow indexing if this page should rank'))
     xrt = (tech.get('xRobotsTag') or '')
     if isinstance(xrt, str) and xrt:
-        if 'noindex' in xrt.lower():
+        xrt = xrt.lower()
+        if 'noindex' in xrt:
             issues.append(Issue(url, 'NOINDEX_HEADER', 'X-Robots-Tag noindex', 'warning', 'technical', 'Remove header noindex if page should be indexed'))
-        if 'nofollow' in xrt.lower():
+        if 'nofollow' in xrt:
             issues.append(Issue(url, 'NOFOLLOW_HEADER', 'X-Robots-Tag nofollow', 'notice', 'technical', 'Header nofollow present'))
     # Nofollow page via meta
     if tech.get('hasMetaNofollowDirective'):
@@ -169,14 +183,9 @@ def derive_issues(url: str, page_attrs: Dict[str, Any]) -> List[Issue]:
         issues.append(Issue(url, 'NO_OUTGOING_LINKS', 'Page has no outgoing links', 'notice', 'links', 'Consider adding contextual links'))
 
     # HTTPS pages linking to HTTP
-    try:
-        from urllib.parse import urlparse
-        if urlparse(url).scheme == 'https':
-            http_links = [l for l in (onpage.get('internalLinks') or []) if l.startswith('http://')]
-            if http_links:
-                issues.append(Issue(url, 'HTTPS_LINKS_TO_HTTP', 'HTTPS page links to HTTP', 'warning', 'security', 'Update internal links to HTTPS'))
-    except Exception:
-        pass
+    if pu is not None and pu.scheme == 'https':
+        if any(l.startswith('http://') for l in (onpage.get('internalLinks') or [])):
+            issues.append(Issue(url, 'HTTPS_LINKS_TO_HTTP', 'HTTPS page links to HTTP', 'warning', 'security', 'Update internal links to HTTPS'))
 
     # Resource & Performance: broken JS/CSS and large files (heuristic based on caching/minification checks)
     js_cache = (tech.get('javascriptCachingTest') or {}).get('details') or []
@@ -204,16 +213,12 @@ def derive_issues(url: str, page_attrs: Dict[str, Any]) -> List[Issue]:
             issues.append(Issue(url, 'CANONICAL_TO_5XX', f'Canonical points to 5xx ({csc})', 'error', 'technical', 'Fix canonical target server error'))
 
     # URL Structure
-    try:
-        from urllib.parse import urlparse
-        pu = urlparse(url)
+    if pu is not None:
         path = pu.path or '/'
         if '//' in path:
             issues.append(Issue(url, 'DOUBLE_SLASH_URL', 'Double slash in URL path', 'notice', 'technical', 'Normalize URL path'))
         if '%' in path:
             issues.append(Issue(url, 'URL_ENCODING', 'URL encoding present in path', 'notice', 'technical', 'Avoid unnecessary encodings in URLs'))
-    except Exception:
-        pass
 
     # SSL/HTTPS
     if tech.get('hasHttps') is False:
@@ -252,30 +257,30 @@ def derive_site_issues(pages: List[Dict[str, Any]], nodes: Dict[str, Dict[str, i
         if sc and 300 <= sc < 400 and nodes.get(u, {}).get('in', 0) == 0:
             issues.append(Issue(u, 'REDIRECT_NO_INBOUND', 'Redirected page with no incoming links', 'notice', 'links', 'Remove or update references'))
 
-    # Nofollow-only inbound / mixed
-    inbound_map: Dict[str, List[List[str]]] = {u: [] for u in url_set}
+    # One pass over edges: rel lists of inbound links per crawled target, and each distinct
+    # (source, redirected target) pair for the links-to-redirects check
+    redirect_urls = {u for u, sc in sc_map.items() if sc and 300 <= sc < 400}
+    inbound_map: Dict[str, List[List[str]]] = defaultdict(list)
+    redirect_links: Dict[Tuple[str, str], None] = {}
     for e in edges:
         tgt = e.get('target')
-        rel = e.get('rel') or []
-        if tgt in inbound_map:
-            inbound_map[tgt].append(rel)
+        if tgt in url_set:
+            inbound_map[tgt].append(e.get('rel') or [])
+        if tgt in redirect_urls:
+            redirect_links[(e.get('source'), tgt)] = None
+
+    # Nofollow-only inbound / mixed
     for u, rel_lists in inbound_map.items():
-        if not rel_lists:
-            continue
-        any_dofollow = any(('nofollow' not in (rl or [])) for rl in rel_lists)
-        any_nofollow = any(('nofollow' in (rl or [])) for rl in rel_lists)
+        any_dofollow = any(('nofollow' not in rl) for rl in rel_lists)
+        any_nofollow = any(('nofollow' in rl) for rl in rel_lists)
         if not any_dofollow and any_nofollow:
             issues.append(Issue(u, 'NOFOLLOW_ONLY_INBOUND', 'Nofollow-only incoming internal links', 'notice', 'links', 'Add at least one dofollow internal link'))
         elif any_dofollow and any_nofollow:
             issues.append(Issue(u, 'MIXED_INBOUND_FOLLOWS', 'Nofollow and dofollow incoming links', 'notice', 'links', 'Consider link policy consistency'))
 
     # Pages linking to redirects
-    status_map = sc_map
-    for e in edges:
-        src = e.get('source')
-        tgt = e.get('target')
-        if tgt in status_map and status_map[tgt] and 300 <= status_map[tgt] < 400:
-            issues.append(Issue(src, 'LINKS_TO_REDIRECTS', 'Page has links to redirects', 'notice', 'links', 'Update links to final URLs'))
+    for src, _ in redirect_links:
+        issues.append(Issue(src, 'LINKS_TO_REDIRECTS', 'Page has links to redirects', 'notice', 'links', 'Update links to final URLs'))
     # Sitemap issues summary
     if sitemap_report and sitemap_report.get('sitemapUrls'):
         buckets = sitemap_report.get('statusBuckets', {})
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def conditional_headers(record: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Validators from a previous run's response, for a conditional GET."""
+    headers = {}
+    if record.get('etag'):
+        headers['If-None-Match'] = record['etag']
+    if record.get('last_modified'):
+        headers['If-Modified-Since'] = record['last_modified']
+    return headers or None
+
+
+def config_fingerprint(app_config: Dict[str, Any], target_keywords: Optional[List[str]], weights: Dict[str, Any]) -> str:
+    """Hash of everything besides the page body that per-page results depend on."""
+    payload = json.dumps(
+        {'config': app_config, 'keywords': sorted(target_keywords or []), 'weights': weights},
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_page_cache(path: str, fingerprint: str) -> Dict[str, Dict[str, Any]]:
+    # A missing, unreadable or differently-configured cache just means every page is analyzed afresh
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+        return {}
+    pages = data.get('pages')
+    return pages if isinstance(pages, dict) else {}
+
+
+def save_page_cache(path: str, cache: Dict[str, Dict[str, Any]], fingerprint: str) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # Write beside the target and swap in, so an interrupted run can't leave a truncated cache
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'pages': cache}, f, default=str)
+    os.replace(tmp_path, path)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from xml.etree import ElementTree as ET
 
 
@@ -77,7 +79,30 @@ def parse_sitemap(base_domain_url: str, robots_txt_content: Optional[str] = None
     }
 
 
-def probe_url_statuses(urls: List[str], timeout: int = 10) -> Dict[str, Any]:
+def _probe_status(session: requests.Session, url: str, timeout: int) -> str:
+    try:
+        resp = session.head(url, timeout=timeout, allow_redirects=False)
+        if resp is None:
+            return 'error'
+        sc = resp.status_code
+        if sc == 200:
+            return 'ok_200'
+        elif 300 <= sc < 400:
+            return 'redirect_3xx'
+        elif sc == 403:
+            return 'forbidden_403'
+        elif 400 <= sc < 500:
+            return 'client_error_4xx'
+        elif 500 <= sc < 600:
+            return 'server_error_5xx'
+        return 'error'
+    except requests.Timeout:
+        return 'timeout'
+    except requests.RequestException:
+        return 'error'
+
+
+def probe_url_statuses(urls: List[str], timeout: int = 10, workers: int = 16) -> Dict[str, Any]:
     buckets = {
         'ok_200': [],
         'redirect_3xx': [],
@@ -87,28 +112,15 @@ def probe_url_statuses(urls: List[str], timeout: int = 10) -> Dict[str, Any]:
         'timeout': [],
         'error': [],
     }
-    for u in urls:
-        try:
-            resp = requests.head(u, timeout=timeout, allow_redirects=False)
-            if resp is None:
-                buckets['error'].append(u)
-                continue
-            sc = resp.status_code
-            if sc == 200:
-                buckets['ok_200'].append(u)
-            elif 300 <= sc < 400:
-                buckets['redirect_3xx'].append(u)
-            elif sc == 403:
-                buckets['forbidden_403'].append(u)
-            elif 400 <= sc < 500:
-                buckets['client_error_4xx'].append(u)
-            elif 500 <= sc < 600:
-                buckets['server_error_5xx'].append(u)
-            else:
-                buckets['error'].append(u)
-        except requests.Timeout:
-            buckets['timeout'].append(u)
-        except requests.RequestException:
-            buckets['error'].append(u)
+    if not urls:
+        return buckets
+    workers = max(1, min(workers, len(urls)))
+    # HEAD requests are I/O-bound, so probe concurrently over one pooled session; map keeps each bucket in input order
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for u, bucket in zip(urls, ex.map(lambda u: _probe_status(session, u, timeout), urls)):
+                buckets[bucket].append(u)
     return buckets
-
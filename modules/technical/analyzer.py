@@ -1,6 +1,7 @@
+from functools import partial
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from ..base_module import SEOModule
+from ..base_module import SEOModule, HTML_PARSER
 from .network import make_request
 from .html_core import (
     check_doctype,
@@ -51,12 +52,16 @@ class TechnicalSEOAnalyzer(SEOModule):
         self.enable_psi = bool(self.tech_config.get("enable_pagespeed_insights", False))
         self.psi_api_key = self.tech_config.get("psi_api_key")
         self.psi_strategy = self.tech_config.get("psi_strategy", "desktop")
+        # All technical probes share the module's pooled session
+        self._request = partial(make_request, session=self.session)
 
-    def analyze(self, url: str) -> dict:
+    def analyze(self, url: str, soup: BeautifulSoup | None = None) -> dict:
+        # The response is always requested here for its headers and timing; a `soup` the caller
+        # already parsed from the same page is used instead of parsing the body again
         results = {"technical_seo_status": "pending", "url_analyzed": url}
 
-        main_response, ttfb = make_request(url, headers=self.headers, timeout=self.request_timeout, allow_redirects=True)
-        soup = None
+        main_response, ttfb = self._request(url, headers=self.headers, timeout=self.request_timeout, allow_redirects=True)
+        prefetched_soup, soup = soup, None
         raw_html_content = b""
         if main_response:
             results["httpStatusCode"] = main_response.status_code
@@ -81,10 +86,13 @@ class TechnicalSEOAnalyzer(SEOModule):
             }
             results["cdnUsageHeuristic"] = check_cdn_headers(main_response.headers)
             results["siteLoadingSpeedTest"] = {"ttfb_seconds": round(ttfb, 3) if ttfb is not None else None, "details": "TTFB only. Full speed test requires browser-based tools."}
-            try:
-                soup = BeautifulSoup(raw_html_content, 'html.parser')
-            except Exception as e:
-                results["soup_parsing_error"] = str(e)
+            if prefetched_soup is not None:
+                soup = prefetched_soup
+            else:
+                try:
+                    soup = BeautifulSoup(raw_html_content, HTML_PARSER)
+                except Exception as e:
+                    results["soup_parsing_error"] = str(e)
         else:
             results["initial_request_failed"] = True
             results["siteLoadingSpeedTest"] = {"ttfb_seconds": None, "details": "Initial request failed."}
@@ -118,7 +126,7 @@ class TechnicalSEOAnalyzer(SEOModule):
                 if can_url:
                     probe = {"status": "skipped"}
                     # No redirects to classify the target itself
-                    resp, _ = make_request(can_url, headers=self.headers, timeout=self.request_timeout, method="head", allow_redirects=False)
+                    resp, _ = self._request(can_url, headers=self.headers, timeout=self.request_timeout, method="head", allow_redirects=False)
                     if resp is not None:
                         sc = resp.status_code
                         probe.update({
@@ -139,12 +147,12 @@ class TechnicalSEOAnalyzer(SEOModule):
             'max_js_to_check_cache': self.tech_config.get('max_js_to_check_cache', 10),
             'max_css_to_check_cache': self.tech_config.get('max_css_to_check_cache', 10),
         }
-        results.update(analyze_asset_caching(soup, base_domain_url, 'image', make_request, self.headers, self.request_timeout, limits))
-        results.update(analyze_asset_caching(soup, base_domain_url, 'javascript', make_request, self.headers, self.request_timeout, limits))
-        results.update(analyze_asset_caching(soup, base_domain_url, 'css', make_request, self.headers, self.request_timeout, limits))
+        results.update(analyze_asset_caching(soup, base_domain_url, 'image', self._request, self.headers, self.request_timeout, limits))
+        results.update(analyze_asset_caching(soup, base_domain_url, 'javascript', self._request, self.headers, self.request_timeout, limits))
+        results.update(analyze_asset_caching(soup, base_domain_url, 'css', self._request, self.headers, self.request_timeout, limits))
 
-        results.update(analyze_asset_minification(soup, base_domain_url, 'javascript', make_request, self.headers, self.request_timeout, self.tech_config))
-        results.update(analyze_asset_minification(soup, base_domain_url, 'css', make_request, self.headers, self.request_timeout, self.tech_config))
+        results.update(analyze_asset_minification(soup, base_domain_url, 'javascript', self._request, self.headers, self.request_timeout, self.tech_config))
+        results.update(analyze_asset_minification(soup, base_domain_url, 'css', self._request, self.headers, self.request_timeout, self.tech_config))
 
         # Optional PageSpeed Insights (Lighthouse/CrUX)
         if self.enable_psi:
@@ -153,17 +161,17 @@ class TechnicalSEOAnalyzer(SEOModule):
 
         # Site-level checks
         results.update(check_https_usage(parsed_url))
-        robots_check_result = check_robots_txt(base_domain_url, make_request, self.headers, self.request_timeout)
+        robots_check_result = check_robots_txt(base_domain_url, self._request, self.headers, self.request_timeout)
         results.update(robots_check_result)
-        results.update(check_sitemap_xml(base_domain_url, robots_check_result.get("robots_txt_content_full"), make_request, self.headers, self.request_timeout))
+        results.update(check_sitemap_xml(base_domain_url, robots_check_result.get("robots_txt_content_full"), self._request, self.headers, self.request_timeout))
         results["domainLength"] = len(domain_name)
-        results.update(check_url_redirects(url, make_request, self.headers, self.request_timeout))
-        results.update(check_custom_404_page(base_domain_url, make_request, self.headers, self.request_timeout))
-        results.update(check_directory_browsing(base_domain_url, make_request, self.headers, self.request_timeout))
+        results.update(check_url_redirects(url, self._request, self.headers, self.request_timeout))
+        results.update(check_custom_404_page(base_domain_url, self._request, self.headers, self.request_timeout))
+        results.update(check_directory_browsing(base_domain_url, self._request, self.headers, self.request_timeout))
         results.update(check_spf_records(domain_name))
-        results.update(check_ads_txt(base_domain_url, make_request, self.headers, self.request_timeout))
+        results.update(check_ads_txt(base_domain_url, self._request, self.headers, self.request_timeout))
         # LLMs/AI crawler guidance file (llms.txt / ai.txt)
-        results.update(check_llms_txt(base_domain_url, make_request, self.headers, self.request_timeout))
+        results.update(check_llms_txt(base_domain_url, self._request, self.headers, self.request_timeout))
 
         results["technical_seo_status"] = "completed"
         return {self.module_name: results}
@@ -136,6 +136,7 @@ def analyze_asset_minification(soup: BeautifulSoup, base_url: str, asset_type: s
     for asset_url in external_asset_urls[:config.get(f"max_{asset_type}_to_check_minification", 10)]:
         response = make_request_fn(asset_url, headers=headers, timeout=timeout, method="get")[0]
         if response:
+            # Closed on every path: oversized assets are skipped without reading the streamed body
             try:
                 content_length = response.headers.get('Content-Length')
                 max_size = config.get(f"max_{asset_type}_size_bytes_for_minification", 1 * 1024 * 1024)
@@ -157,6 +158,8 @@ def analyze_asset_minification(soup: BeautifulSoup, base_url: str, asset_type: s
             except Exception as e:
                 results_list.append({"source_url": asset_url, "type": "external", "status": "error_processing_content", "error": str(e)})
                 errors_count += 1
+            finally:
+                response.close()
         else:
             results_list.append({"source_url": asset_url, "type": "external", "status": "error_fetching"})
             errors_count += 1
@@ -29,8 +29,11 @@ def _fetch_first_available_llms_txt(base_domain_url: str, make_request_fn, heade
     ]
     for url in candidates:
         resp, _ = make_request_fn(url, headers=headers, timeout=timeout)
-        if resp and resp.status_code == 200 and resp.text:
-            return url, resp.text, resp.status_code
+        if resp is not None:
+            # Non-200 bodies are never read; closing returns the streamed connection to the pool
+            with resp:
+                if resp.status_code == 200 and resp.text:
+                    return url, resp.text, resp.status_code
         # If explicitly 200 required; skip others but remember last code
         last_status = resp.status_code if resp else None
     return None, None, None
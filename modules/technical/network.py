@@ -1,11 +1,16 @@
 from datetime import datetime
 import requests
 
-def make_request(url, headers: dict, timeout: int, method: str = "get", **kwargs):
+def make_request(url, headers: dict, timeout: int, method: str = "get", session: requests.Session | None = None, **kwargs):
+    # Pass the module's pooled session to reuse connections across the many same-host checks
+    http = session or requests
     try:
-        kwargs.setdefault('stream', True)
+        # GETs stream so callers can read headers (and TTFB) before deciding to download the body;
+        # such callers must read the body or close the response to hand the connection back to the
+        # pool. HEADs have no body to defer.
+        kwargs.setdefault('stream', method.lower() != "head")
         start_time = datetime.now()
-        response = requests.request(method, url, headers=headers, timeout=timeout, **kwargs)
+        response = http.request(method, url, headers=headers, timeout=timeout, **kwargs)
         end_time = datetime.now()
         ttfb = (end_time - start_time).total_seconds()
         return response, ttfb
@@ -13,9 +18,9 @@ def make_request(url, headers: dict, timeout: int, method: str = "get", **kwargs
         print(f"Request failed for {url} in TechnicalSEO: {e}")
         return None, None
 
-def get_asset_response(asset_url: str, headers: dict, timeout: int):
+def get_asset_response(asset_url: str, headers: dict, timeout: int, session: requests.Session | None = None):
     try:
-        return requests.get(asset_url, headers=headers, timeout=timeout, allow_redirects=True)
+        return (session or requests).get(asset_url, headers=headers, timeout=timeout, allow_redirects=True)
     except requests.exceptions.RequestException:
         return None
 
@@ -32,6 +32,8 @@ def check_robots_txt(base_domain_url: str, make_request_fn, headers: dict, timeo
                         has_disallow_all_for_google = True
     elif response is None:
         status = "error_accessing"
+    if response is not None:
+        response.close()
     return {"robotsTxtStatus": status, "robotsTxtSitemapUrls": sitemap_urls,
             "robotsTxtDisallowDirectives": disallow_directives,
             "robotsTxtDisallowsAllGeneral": has_disallow_all_general,
@@ -63,6 +65,7 @@ def check_url_redirects(url: str, make_request_fn, headers: dict, timeout: int)
                 status_codes.append(r_hist.status_code)
         history.append({"url": response.url, "status_code": response.status_code})
         status_codes.append(response.status_code)
+        response.close()  # only the redirect chain is needed, not the body
     else:
         history.append({"url": url, "error": "Request failed"})
     return {"redirectHistory": history, "hasRedirects": len(history) > 1 and any(s // 100 == 3 for s in status_codes)}
@@ -80,10 +83,13 @@ def check_directory_browsing(base_url: str, make_request_fn, headers: dict, time
     paths = []
     for d in ["/css/", "/js/", "/images/", "/uploads/"]:
         response, _ = make_request_fn(urljoin(base_url, d), headers=headers, timeout=timeout)
-        if response and response.status_code == 200:
-            s = BeautifulSoup(response.content, 'html.parser')
-            if s.title and "index of /" in s.title.string.lower():
-                paths.append(d)
+        if response is None:
+            continue
+        with response:
+            if response.status_code == 200:
+                s = BeautifulSoup(response.content, 'html.parser')
+                if s.title and "index of /" in s.title.string.lower():
+                    paths.append(d)
     return {"directoryBrowsingEnabledPaths": paths, "hasDirectoryBrowsingEnabled": bool(paths)}
 
 def check_spf_records(domain: str) -> dict:
@@ -106,6 +112,8 @@ def check_ads_txt(base_url: str, make_request_fn, headers: dict, timeout: int) -
     response, _ = make_request_fn(urljoin(base_url, "/ads.txt"), headers=headers, timeout=timeout)
     if response and response.status_code == 200:
         has_ads = True; content = response.text[:1000]
+    if response is not None:
+        response.close()
     return {"hasAdsTxt": has_ads, "adsTxtPreview": content}
 
 def check_cdn_headers(headers: requests.structures.CaseInsensitiveDict) -> dict:
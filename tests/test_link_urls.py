@@ -0,0 +1,63 @@
+import unittest
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from modules.on_page.dom_index import DomIndex
+from modules.on_page.headings_links_images import _plain_absolute_netloc, check_links
+
+BASE_URL = "https://example.com/dir/page"
+
+HREFS = [
+    "https://example.com/abs",
+    "https://example.com/abs#",
+    "https://example.com/abs?",
+    "https://example.com/abs?#frag",
+    "https://example.com/abs;",
+    "https://example.com/abs?q=1",
+    "https://example.com/abs#section",
+    "https://example.com",
+    "http://example.com/insecure",
+    "https://other.org/x",
+    "https://other.org/x#",
+    "https:///no-host",
+    "https://example.com/tab\tin-path",
+    "/root-relative",
+    "./dot-relative",
+    "?query-only",
+    "relative/path",
+    "//example.com/protocol-relative",
+]
+
+
+class PlainAbsoluteNetlocTest(unittest.TestCase):
+    def test_fast_path_only_for_urls_urljoin_keeps(self):
+        for base in (BASE_URL, "http://example.com/"):
+            for href in HREFS:
+                netloc = _plain_absolute_netloc(href)
+                if netloc:
+                    self.assertEqual(urljoin(base, href), href, href)
+                    self.assertEqual(urlparse(href).netloc, netloc, href)
+
+
+class CheckLinksUrlTest(unittest.TestCase):
+    def test_links_match_urljoin(self):
+        html = "".join(f'<a href="{h}">link</a>' for h in HREFS)
+        dom = DomIndex(BeautifulSoup(html, "html.parser"))
+        result = check_links(dom, BASE_URL, {}, 1, 0, 0)
+
+        expected_internal, expected_external = [], []
+        for a in BeautifulSoup(html, "html.parser").find_all("a"):
+            full_url = urljoin(BASE_URL, a["href"])
+            if urlparse(full_url).netloc == "example.com":
+                expected_internal.append(full_url)
+            else:
+                expected_external.append(full_url)
+        self.assertEqual(result["internalLinks"], expected_internal)
+        self.assertEqual(result["externalLinks"], expected_external)
+        self.assertIn("https://example.com/abs", result["internalLinks"])
+        self.assertNotIn("https://example.com/abs#", result["internalLinks"])
+
+
+if __name__ == "__main__":
+    unittest.main()